@@ -13,7 +13,7 @@ __version__ = "0.1.0-dev"
 from orbveil.core.tle import TLE, parse_tle
 from orbveil.core.propagation import propagate, propagate_batch, StateVector
 from orbveil.core.screening import screen, screen_catalog, filter_stale_tles, ConjunctionEvent
-from orbveil.core.probability import compute_pc, PcMethod, PcResult
+from orbveil.core.probability import compute_pc, compute_pc_batch, PcMethod, PcResult
 from orbveil.data.cdm import CDM, CDMObject
 from orbveil.data.spacetrack import SpaceTrackClient
 
@@ -29,6 +29,7 @@ __all__ = [
     "filter_stale_tles",
     "ConjunctionEvent",
     "compute_pc",
+    "compute_pc_batch",
     "PcMethod",
     "PcResult",
     "CDM",
@@ -4,18 +4,62 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class FormationGroup:
-    """Represents a group of satellites flying in formation or co-located."""
+    """Represents a group of satellites flying in formation or co-located.
+
+    ``norad_ids`` is normalized to an int64 array on construction; a frozenset
+    view backs ``norad_id in group`` membership tests.
+    """
     name: str                    # e.g., "ISS Complex", "PIESAT Formation"
     reason: str                  # e.g., "docked_modules", "formation_flying", "rideshare_dispersing"
-    norad_ids: list[int]
+    norad_ids: NDArray[np.int64]
     object_names: list[str]
 
+    def __post_init__(self) -> None:
+        self.norad_ids = np.asarray(self.norad_ids, dtype=np.int64).reshape(-1)
+
+    @cached_property
+    def _norad_set(self) -> frozenset[int]:
+        return frozenset(self.norad_ids.tolist())
+
+    def __contains__(self, norad_id: object) -> bool:
+        return norad_id in self._norad_set
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FormationGroup):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.reason == other.reason
+            and np.array_equal(self.norad_ids, other.norad_ids)
+            and self.object_names == other.object_names
+        )
+
+
+# Co-location limits for velocity-based detection
+_COLOCATED_MAX_DISTANCE_KM = 5.0
+_COLOCATED_MAX_REL_VELOCITY_KM_S = 0.05
+
+
+def _is_colocated(distance_km: float, rel_velocity_km_s: float) -> bool:
+    """Return True if a pair is close and slow enough to be co-located."""
+    return (
+        0.0 < distance_km <= _COLOCATED_MAX_DISTANCE_KM
+        and rel_velocity_km_s < _COLOCATED_MAX_REL_VELOCITY_KM_S
+    )
+
 
 # Known formation configurations
 KNOWN_FORMATIONS = {
@@ -30,12 +74,56 @@ KNOWN_FORMATIONS = {
     ],
 }
 
+# Prefix formations, checked in priority order
+_PREFIX_FORMATIONS = ('PIESAT', 'TIANHUI', 'O3B')
+
+
+def _build_family_index() -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+    """Compile one union regex over every formation keyword.
+
+    Returns the pattern and a map from matched keyword to family tags
+    (``'iss'``, ``'css'``, ``'tandem0'``, ``'mev1'``, ``'PIESAT'``, ...).
+    A keyword's tags include those of every shorter keyword it contains,
+    since the alternation only reports one match per start position.
+    """
+    families: dict[str, set[str]] = {}
+    for keyword in KNOWN_FORMATIONS['iss_keywords']:
+        families.setdefault(keyword.upper(), set()).add('iss')
+    for keyword in KNOWN_FORMATIONS['css_keywords']:
+        families.setdefault(keyword.upper(), set()).add('css')
+    for k, pair in enumerate(KNOWN_FORMATIONS['tandem']):
+        for keyword in pair:
+            families.setdefault(keyword.upper(), set()).add(f'tandem{k}')
+    for k, pair in enumerate(KNOWN_FORMATIONS['mev_dockings']):
+        for keyword in pair:
+            families.setdefault(keyword.upper(), set()).add(f'mev{k}')
+    for prefix in _PREFIX_FORMATIONS:
+        families.setdefault(prefix, set()).add(prefix)
+
+    tags = {
+        keyword: frozenset().union(*(f for other, f in families.items() if other in keyword))
+        for keyword in families
+    }
+    # Zero-width lookahead so overlapping keywords are all found
+    alternation = '|'.join(re.escape(k) for k in sorted(families, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))'), tags
+
+
+# Lookups derived from KNOWN_FORMATIONS once at import time
+_ISS_NORAD_IDS = frozenset(KNOWN_FORMATIONS['iss_core'])
+_FAMILY_RE, _FAMILY_TAGS = _build_family_index()
+
+
+def _name_families(name_upper: str) -> frozenset[str]:
+    """Return the formation family tags whose keywords occur in a name."""
+    return frozenset().union(*(_FAMILY_TAGS[m.group(1)] for m in _FAMILY_RE.finditer(name_upper)))
+
 
 def detect_formations(
     names: list[str],
     norad_ids: list[int],
-    positions: list[tuple[float, float, float]] | None = None,  # km, TEME
-    velocities: list[tuple[float, float, float]] | None = None,  # km/s, TEME
+    positions: NDArray[np.float64] | None = None,  # (N, 3) km, TEME
+    velocities: NDArray[np.float64] | None = None,  # (N, 3) km/s, TEME
     cospar_ids: list[str] | None = None,
 ) -> list[FormationGroup]:
     """
@@ -44,8 +132,9 @@ def detect_formations(
     Args:
         names: Object names
         norad_ids: NORAD catalog IDs
-        positions: Optional position vectors (km, TEME)
-        velocities: Optional velocity vectors (km/s, TEME)
+        positions: Optional (N, 3) position array (km, TEME); any array-like
+            of 3-vectors is accepted and converted to contiguous float64
+        velocities: Optional (N, 3) velocity array (km/s, TEME), same rules
         cospar_ids: Optional COSPAR/international designators
         
     Returns:
@@ -54,6 +143,11 @@ def detect_formations(
     if len(names) != len(norad_ids):
         raise ValueError("names and norad_ids must have same length")
     
+    if positions is not None:
+        positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 3)
+    if velocities is not None:
+        velocities = np.ascontiguousarray(velocities, dtype=np.float64).reshape(-1, 3)
+    
     n_objects = len(names)
     formations = []
     assigned = set()  # Track which objects are already in a formation
@@ -63,14 +157,13 @@ def detect_formations(
     norad_to_idx = {norad_ids[i]: i for i in range(n_objects)}
     idx_to_norad = {i: norad_ids[i] for i in range(n_objects)}
     
+    # Tag every name with its keyword families in a single scan
+    tags = [_name_families(name.upper()) for name in names]
+    
     # 1. Check for ISS complex
     iss_indices = []
     for i in range(n_objects):
-        if norad_ids[i] in KNOWN_FORMATIONS['iss_core']:
-            iss_indices.append(i)
-            continue
-        name_upper = names[i].upper()
-        if any(keyword.upper() in name_upper for keyword in KNOWN_FORMATIONS['iss_keywords']):
+        if norad_ids[i] in _ISS_NORAD_IDS or 'iss' in tags[i]:
             iss_indices.append(i)
     
     if iss_indices:
@@ -87,8 +180,7 @@ def detect_formations(
     for i in range(n_objects):
         if i in assigned:
             continue
-        name_upper = names[i].upper()
-        if any(keyword.upper() in name_upper for keyword in KNOWN_FORMATIONS['css_keywords']):
+        if 'css' in tags[i]:
             css_indices.append(i)
     
     if css_indices:
@@ -101,14 +193,8 @@ def detect_formations(
         assigned.update(css_indices)
     
     # 3. Check for known pairs (TanDEM, MEV dockings)
-    for pair in KNOWN_FORMATIONS['tandem']:
-        indices = []
-        for i in range(n_objects):
-            if i in assigned:
-                continue
-            name_upper = names[i].upper()
-            if any(p.upper() in name_upper for p in pair):
-                indices.append(i)
+    for k, pair in enumerate(KNOWN_FORMATIONS['tandem']):
+        indices = [i for i in range(n_objects) if i not in assigned and f'tandem{k}' in tags[i]]
         if len(indices) >= 2:
             formations.append(FormationGroup(
                 name="TanDEM-X Formation",
@@ -118,14 +204,8 @@ def detect_formations(
             ))
             assigned.update(indices)
     
-    for pair in KNOWN_FORMATIONS['mev_dockings']:
-        indices = []
-        for i in range(n_objects):
-            if i in assigned:
-                continue
-            name_upper = names[i].upper()
-            if any(p.upper() in name_upper for p in pair):
-                indices.append(i)
+    for k, pair in enumerate(KNOWN_FORMATIONS['mev_dockings']):
+        indices = [i for i in range(n_objects) if i not in assigned and f'mev{k}' in tags[i]]
         if len(indices) == 2:
             formations.append(FormationGroup(
                 name=f"{pair[0]}/{pair[1]} Docking",
@@ -140,26 +220,10 @@ def detect_formations(
     for i in range(n_objects):
         if i in assigned:
             continue
-        name = names[i].upper()
-        
-        # PIESAT pattern
-        if 'PIESAT' in name:
-            key = 'PIESAT'
-            if key not in prefix_groups:
-                prefix_groups[key] = []
-            prefix_groups[key].append(i)
-        # TIANHUI pattern
-        elif 'TIANHUI' in name:
-            key = 'TIANHUI'
-            if key not in prefix_groups:
-                prefix_groups[key] = []
-            prefix_groups[key].append(i)
-        # O3B pattern
-        elif 'O3B' in name:
-            key = 'O3B'
-            if key not in prefix_groups:
-                prefix_groups[key] = []
-            prefix_groups[key].append(i)
+        # First matching prefix wins (PIESAT, then TIANHUI, then O3B)
+        key = next((p for p in _PREFIX_FORMATIONS if p in tags[i]), None)
+        if key is not None:
+            prefix_groups.setdefault(key, []).append(i)
     
     for prefix, indices in prefix_groups.items():
         if len(indices) >= 2:
@@ -172,36 +236,36 @@ def detect_formations(
             assigned.update(indices)
     
     # 5. Velocity-based detection (requires positions and velocities)
-    if positions and velocities and len(positions) == n_objects and len(velocities) == n_objects:
-        for i in range(n_objects):
-            if i in assigned:
+    if (positions is not None and velocities is not None
+            and n_objects > 1 and len(positions) == n_objects and len(velocities) == n_objects):
+        # Objects whose propagation failed carry NaN rows; leave them out of the
+        # spatial index and map tree indices back to catalog indices
+        finite = np.flatnonzero(
+            np.isfinite(positions).all(axis=1) & np.isfinite(velocities).all(axis=1)
+        )
+        pos = positions[finite]
+        vel = velocities[finite]
+
+        # Spatial index: only pairs within 5 km (inclusive) come back
+        pairs = cKDTree(pos).query_pairs(r=_COLOCATED_MAX_DISTANCE_KM, output_type='ndarray')
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+        # Co-located: rel_vel < 0.05 km/s on the short candidate list
+        dv2 = np.sum((vel[pairs[:, 1]] - vel[pairs[:, 0]]) ** 2, axis=-1)
+        pairs = finite[pairs[dv2 < _COLOCATED_MAX_REL_VELOCITY_KM_S**2]]
+
+        # Sorted (i, j) order keeps the greedy first-match pairing per object
+        for i, j in pairs:
+            i, j = int(i), int(j)
+            if i in assigned or j in assigned:
                 continue
-            for j in range(i + 1, n_objects):
-                if j in assigned:
-                    continue
-                
-                # Calculate distance
-                dx = positions[j][0] - positions[i][0]
-                dy = positions[j][1] - positions[i][1]
-                dz = positions[j][2] - positions[i][2]
-                distance = (dx**2 + dy**2 + dz**2)**0.5
-                
-                # Calculate relative velocity
-                dvx = velocities[j][0] - velocities[i][0]
-                dvy = velocities[j][1] - velocities[i][1]
-                dvz = velocities[j][2] - velocities[i][2]
-                rel_velocity = (dvx**2 + dvy**2 + dvz**2)**0.5
-                
-                # Check if co-located (within 5km and rel_vel < 0.05 km/s)
-                if distance <= 5.0 and rel_velocity < 0.05:
-                    formations.append(FormationGroup(
-                        name=f"Co-located Pair ({names[i]}/{names[j]})",
-                        reason="velocity_based",
-                        norad_ids=[norad_ids[i], norad_ids[j]],
-                        object_names=[names[i], names[j]]
-                    ))
-                    assigned.update([i, j])
-                    break
+            formations.append(FormationGroup(
+                name=f"Co-located Pair ({names[i]}/{names[j]})",
+                reason="velocity_based",
+                norad_ids=[norad_ids[i], norad_ids[j]],
+                object_names=[names[i], names[j]]
+            ))
+            assigned.update([i, j])
     
     # 6. COSPAR/launch-based detection
     if cospar_ids and len(cospar_ids) == n_objects:
@@ -217,42 +281,42 @@ def detect_formations(
                     launch_groups[launch_id] = []
                 launch_groups[launch_id].append(i)
         
-        # Check if objects from same launch are within 5km
-        if positions:
+        # Group objects from the same launch that are chained within 5km
+        if positions is not None and len(positions) == n_objects:
+            launch_pos = positions
             for launch_id, indices in launch_groups.items():
                 if len(indices) < 2:
                     continue
                 
                 # Check if launch is within 30 days (approximate from year-launch number)
                 # For simplicity, we'll group all from same launch if they're close
-                close_pairs = []
-                for i in indices:
-                    for j in indices:
-                        if i >= j:
-                            continue
-                        dx = positions[j][0] - positions[i][0]
-                        dy = positions[j][1] - positions[i][1]
-                        dz = positions[j][2] - positions[i][2]
-                        distance = (dx**2 + dy**2 + dz**2)**0.5
-                        
-                        if distance <= 5.0:
-                            if i not in [idx for pair in close_pairs for idx in pair]:
-                                if j not in [idx for pair in close_pairs for idx in pair]:
-                                    close_pairs.append((i, j))
+                members = np.asarray(indices)
+                # Drop members whose propagation failed (NaN rows)
+                members = members[np.isfinite(launch_pos[members]).all(axis=1)]
+                if len(members) < 2:
+                    continue
+                pairs = cKDTree(launch_pos[members]).query_pairs(
+                    r=_COLOCATED_MAX_DISTANCE_KM, output_type='ndarray'
+                )
+                if len(pairs) == 0:
+                    continue
                 
-                # Group all close pairs from same launch
-                if close_pairs:
-                    all_indices = set()
-                    for pair in close_pairs:
-                        all_indices.update(pair)
-                    
+                # One rideshare group per connected component of close pairs
+                adjacency = coo_matrix(
+                    (np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])),
+                    shape=(len(members), len(members)),
+                )
+                _, labels = connected_components(adjacency, directed=False)
+                sizes = np.bincount(labels)
+                for label in np.flatnonzero(sizes >= 2):
+                    group = members[labels == label].tolist()
                     formations.append(FormationGroup(
                         name=f"Rideshare Group ({launch_id})",
                         reason="rideshare_dispersing",
-                        norad_ids=[norad_ids[i] for i in all_indices],
-                        object_names=[names[i] for i in all_indices]
+                        norad_ids=[norad_ids[i] for i in group],
+                        object_names=[names[i] for i in group]
                     ))
-                    assigned.update(all_indices)
+                    assigned.update(group)
     
     logger.debug("Detected %d formations from %d objects", len(formations), n_objects)
     return formations
@@ -281,27 +345,17 @@ def is_formation_pair(
     name1_upper = name1.upper()
     name2_upper = name2.upper()
     
-    # Check ISS complex
-    iss_ids = set(KNOWN_FORMATIONS['iss_core'])
-    iss_match = False
-    if norad_id1 in iss_ids or norad_id2 in iss_ids:
-        iss_match = True
-    if not iss_match:
-        for keyword in KNOWN_FORMATIONS['iss_keywords']:
-            if keyword.upper() in name1_upper or keyword.upper() in name2_upper:
-                iss_match = True
-                break
-    if iss_match:
-        # Check if both are ISS-related
-        iss_related_1 = norad_id1 in iss_ids or any(k.upper() in name1_upper for k in KNOWN_FORMATIONS['iss_keywords'])
-        iss_related_2 = norad_id2 in iss_ids or any(k.upper() in name2_upper for k in KNOWN_FORMATIONS['iss_keywords'])
-        if iss_related_1 and iss_related_2:
-            return (True, "ISS Complex (docked_modules)")
+    tags1 = _name_families(name1_upper)
+    tags2 = _name_families(name2_upper)
+    
+    # Check ISS complex (both objects must be ISS-related)
+    iss_related_1 = norad_id1 in _ISS_NORAD_IDS or 'iss' in tags1
+    iss_related_2 = norad_id2 in _ISS_NORAD_IDS or 'iss' in tags2
+    if iss_related_1 and iss_related_2:
+        return (True, "ISS Complex (docked_modules)")
     
     # Check CSS complex
-    css_related_1 = any(k.upper() in name1_upper for k in KNOWN_FORMATIONS['css_keywords'])
-    css_related_2 = any(k.upper() in name2_upper for k in KNOWN_FORMATIONS['css_keywords'])
-    if css_related_1 and css_related_2:
+    if 'css' in tags1 and 'css' in tags2:
         return (True, "CSS Complex (docked_modules)")
     
     # Check TanDEM pair
@@ -317,21 +371,51 @@ def is_formation_pair(
             return (True, f"{pair[0]}/{pair[1]} Docking (docked_servicing)")
     
     # Check for common prefix formations
-    if 'PIESAT' in name1_upper and 'PIESAT' in name2_upper:
+    if 'PIESAT' in tags1 and 'PIESAT' in tags2:
         return (True, "PIESAT Formation (formation_flying)")
-    if 'TIANHUI' in name1_upper and 'TIANHUI' in name2_upper:
+    if 'TIANHUI' in tags1 and 'TIANHUI' in tags2:
         return (True, "TIANHUI Formation (formation_flying)")
-    if 'O3B' in name1_upper and 'O3B' in name2_upper:
+    if 'O3B' in tags1 and 'O3B' in tags2:
         return (True, "O3B Constellation (constellation_slots)")
     
     # Velocity-based check
-    if distance_km > 0 and distance_km <= 5.0 and rel_velocity_km_s < 0.05:
+    if _is_colocated(distance_km, rel_velocity_km_s):
         return (True, "Co-located (velocity_based)")
     
     # NOT a formation (e.g., Starlink satellites)
     return (False, "")
 
 
+def _same_formation(
+    event_ids: NDArray[np.int64],
+    formations: list[FormationGroup],
+) -> NDArray[np.bool_]:
+    """Flag (id1, id2) rows whose two distinct IDs belong to the same formation.
+
+    Formation IDs are flattened into one sorted array with a parallel array of
+    formation labels, and both columns are looked up with ``np.searchsorted``.
+    """
+    distinct = event_ids[:, 0] != event_ids[:, 1]
+    member_ids = [np.unique(f.norad_ids) for f in formations]
+    all_ids = np.concatenate(member_ids)
+    labels = np.repeat(np.arange(len(formations)), [ids.size for ids in member_ids])
+    order = np.argsort(all_ids, kind='stable')
+    all_ids, labels = all_ids[order], labels[order]
+    
+    if all_ids.size == 0:
+        return np.zeros(len(event_ids), dtype=bool)
+    if np.any(all_ids[1:] == all_ids[:-1]):
+        # An ID shared by several formations has no single label; test each formation
+        hit = np.zeros(len(event_ids), dtype=bool)
+        for ids in member_ids:
+            hit |= np.isin(event_ids, ids).all(axis=1)
+        return distinct & hit
+    
+    idx = np.searchsorted(all_ids, event_ids).clip(max=all_ids.size - 1)
+    found = (all_ids[idx] == event_ids).all(axis=1)
+    return distinct & found & (labels[idx[:, 0]] == labels[idx[:, 1]])
+
+
 def filter_formation_events(
     events: list[dict],
     formations: list[FormationGroup] | None = None,
@@ -351,23 +435,25 @@ def filter_formation_events(
     real_threats = []
     formation_events = []
     
-    # Build formation lookup if provided
-    formation_pairs = set()
-    if formations:
-        for formation in formations:
-            norad_list = formation.norad_ids
-            for i in range(len(norad_list)):
-                for j in range(i + 1, len(norad_list)):
-                    # Store both orderings
-                    formation_pairs.add((norad_list[i], norad_list[j]))
-                    formation_pairs.add((norad_list[j], norad_list[i]))
+    # Label events whose two objects share a known formation
+    in_formation = np.zeros(len(events), dtype=bool)
+    if formations and events:
+        event_ids = np.array(
+            [
+                [-1 if e.get('norad_id1') is None else e['norad_id1'],
+                 -1 if e.get('norad_id2') is None else e['norad_id2']]
+                for e in events
+            ],
+            dtype=np.int64,
+        )
+        in_formation = _same_formation(event_ids, formations)
     
-    for event in events:
+    for event, known_pair in zip(events, in_formation):
         norad_id1 = event.get('norad_id1')
         norad_id2 = event.get('norad_id2')
         
         # Check if this pair is in a known formation
-        if formations and (norad_id1, norad_id2) in formation_pairs:
+        if known_pair:
             formation_events.append(event)
             continue
         
@@ -7,6 +7,7 @@ given conjunction geometry and covariance data.
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass
 from enum import Enum
 
@@ -14,7 +15,9 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 from numpy.typing import NDArray
-from scipy.integrate import dblquad
+from scipy.integrate import quad
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 
 class PcMethod(Enum):
@@ -22,6 +25,7 @@ class PcMethod(Enum):
 
     FOSTER_1992 = "foster_1992"
     MONTE_CARLO = "monte_carlo"
+    QUASI_MONTE_CARLO = "quasi_monte_carlo"
 
 
 @dataclass
@@ -128,76 +132,134 @@ def _project_to_bplane(
     return miss_2d, cov_2d
 
 
+def _is_zero_covariance(cov: NDArray | None) -> bool:
+    """Return True for a missing (``None``) or all-zero covariance."""
+    return cov is None or not np.any(cov)
+
+
 def compute_pc_foster(
     miss_2d: NDArray,
-    cov_2d: NDArray,
+    cov_2d: NDArray | None,
     hard_body_radius: float,
 ) -> float:
-    """Compute Pc via numerical integration of bivariate normal over hard-body disk.
+    """Compute Pc by integrating the bivariate normal over the hard-body disk.
     
-    Uses scipy.integrate.dblquad in polar coordinates to compute:
-        Pc = ∫∫_circle PDF(x, y) dx dy
-    where PDF is the 2D Gaussian with covariance cov_2d centered at miss_2d.
+    The B-plane is rotated onto the principal axes of cov_2d, where the two
+    coordinates are independent. The inner integral across each chord of the
+    disk then has a closed form in erf, leaving a single 1-D quadrature:
+        Pc = ∫_{-R}^{R} N(x; mx, sx²) · P(|y| ≤ √(R² - x²)) dx
+    with (mx, my) the miss vector and sx, sy the standard deviations in the
+    principal-axis frame.
     
     Args:
         miss_2d: 2D miss vector in B-plane (km)
-        cov_2d: 2x2 covariance matrix in B-plane (km²)
+        cov_2d: 2x2 covariance matrix in B-plane (km²), or None for no uncertainty
         hard_body_radius: Combined hard-body radius (km)
         
     Returns:
         Collision probability (0 to 1)
     """
+    if _is_zero_covariance(cov_2d):
+        # No uncertainty - nothing to integrate
+        return 0.0
+    
     # Check for singular covariance
     det = np.linalg.det(cov_2d)
     if det < 1e-20:
         # Covariance is nearly singular - probability is essentially 0
         return 0.0
     
-    # Invert covariance matrix
-    cov_inv = np.linalg.inv(cov_2d)
-    
-    # Mean of the distribution (center of miss ellipse)
-    mx, my = miss_2d
-    
-    # Normalization factor for 2D Gaussian
-    norm_factor = 1.0 / (2.0 * np.pi * np.sqrt(det))
-    
-    # Define the 2D Gaussian PDF in Cartesian coordinates
-    def pdf_cartesian(x, y):
-        r = np.array([x - mx, y - my])
-        exponent = -0.5 * (r @ cov_inv @ r)
-        return norm_factor * np.exp(exponent)
-    
-    # Integrate over a circular disk using polar coordinates
-    # x = r * cos(theta), y = r * sin(theta)
-    # Jacobian: r
-    # Integrate: ∫_0^R ∫_0^2π PDF(r*cos(θ), r*sin(θ)) * r dθ dr
-    
-    def integrand_polar(theta, r):
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        return pdf_cartesian(x, y) * r  # r is the Jacobian
-    
-    # Perform double integration in polar coordinates
-    # dblquad integrates over theta first (inner), then r (outer)
-    result, error = dblquad(
-        integrand_polar,
-        0.0, hard_body_radius,  # r from 0 to hard_body_radius
-        lambda r: 0.0, lambda r: 2.0 * np.pi,  # theta from 0 to 2π
-        epsabs=1e-10, epsrel=1e-6
+    # Rotate the miss vector into the principal-axis frame of the covariance
+    eigvals, eigvecs = np.linalg.eigh(cov_2d)
+    mx, my = eigvecs.T @ miss_2d
+    sx, sy = np.sqrt(eigvals)
+    
+    # Plain floats so the integrand runs on math.* scalars, not NumPy ufuncs
+    mx, my, sx = float(mx), float(my), float(sx)
+    sy_sqrt2 = float(sy) * math.sqrt(2.0)
+    norm_x = 1.0 / (sx * math.sqrt(2.0 * math.pi))
+    r_sq = hard_body_radius * hard_body_radius
+    
+    def integrand(x):
+        # Gaussian density along x times the y-probability mass of the chord at x
+        half_chord = math.sqrt(max(r_sq - x * x, 0.0))
+        chord_mass = 0.5 * (
+            math.erf((half_chord - my) / sy_sqrt2) + math.erf((half_chord + my) / sy_sqrt2)
+        )
+        return norm_x * math.exp(-0.5 * ((x - mx) / sx) ** 2) * chord_mass
+    
+    # Integrate only where the x-density is non-negligible (±8σ, clipped to the
+    # disk). Over the full chord range a narrow Gaussian can fall between the
+    # adaptive quadrature's sample points and be missed entirely.
+    lo = max(-hard_body_radius, mx - 8.0 * sx)
+    hi = min(hard_body_radius, mx + 8.0 * sx)
+    if lo >= hi:
+        return 0.0
+    
+    # Flag the density peak to the adaptive quadrature when it lies inside the range
+    peak = [mx] if lo < mx < hi else None
+    result, error = quad(
+        integrand, lo, hi, points=peak,
+        epsabs=1e-10, epsrel=1e-6,
     )
     
     # Clamp to [0, 1]
     return np.clip(result, 0.0, 1.0)
 
 
+def _mvn_sample(
+    mean: NDArray,
+    cov: NDArray,
+    n_samples: int,
+    seed: int,
+    quasi_random: bool = False,
+    rng: np.random.Generator | None = None,
+) -> NDArray:
+    """Draw ``n_samples`` points from N(mean, cov) via a single matrix factor.
+    
+    The covariance is factored once (Cholesky, or a symmetric eigendecomposition
+    when it is only positive semi-definite) and standard normal draws are
+    coloured with one matrix product. Standard normals come either from the
+    seeded PCG64 generator or, with ``quasi_random``, from a scrambled Sobol
+    sequence through the inverse normal CDF. A caller-supplied ``rng`` replaces
+    ``seed`` as the source of randomness (and of the Sobol scrambling).
+    
+    Raises:
+        np.linalg.LinAlgError: If the covariance cannot be factored.
+    """
+    dim = len(mean)
+    try:
+        factor = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        # Singular but PSD: use the eigendecomposition square root instead
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        factor = eigvecs * np.sqrt(np.clip(eigvals, 0.0, None))
+    
+    if quasi_random:
+        # Draw the scrambling seed from ``rng``: handing SciPy the generator itself
+        # spawns a child stream, which a saved bit_generator state cannot replay
+        sobol_seed = seed if rng is None else int(rng.integers(2**63))
+        sobol = qmc.Sobol(d=dim, scramble=True, seed=sobol_seed)
+        # Draw a full power-of-two block to keep the sequence balanced
+        u = sobol.random_base2(m=max(int(np.ceil(np.log2(n_samples))), 0))[:n_samples]
+        z = ndtri(np.clip(u, np.finfo(np.float64).tiny, 1.0 - np.finfo(np.float64).eps))
+    else:
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        z = rng.standard_normal((n_samples, dim))
+    
+    return mean + z @ factor.T
+
+
 def compute_pc_monte_carlo(
     rel_pos: NDArray,
     rel_vel: NDArray | None,
-    cov_combined: NDArray,
+    cov_combined: NDArray | None,
     hard_body_radius: float,
     n_samples: int = 100_000,
     seed: int = 42,
+    quasi_random: bool = False,
+    rng: np.random.Generator | None = None,
 ) -> float:
     """Monte Carlo Pc estimation.
     
@@ -205,29 +267,37 @@ def compute_pc_monte_carlo(
     samples result in a collision. Projects samples onto B-plane (perpendicular
     to relative velocity) to match Foster method.
     
+    With ``quasi_random=True`` the Gaussian samples come from a scrambled Sobol
+    sequence mapped through the inverse normal CDF, whose error shrinks close
+    to O(1/N) rather than O(1/sqrt(N)), so far fewer samples are needed.
+    
     Args:
         rel_pos: Relative position vector (km)
         rel_vel: Relative velocity vector (km/s)
-        cov_combined: Combined 6x6 covariance matrix (position+velocity)
+        cov_combined: Combined 6x6 covariance matrix (position+velocity), or None
+            for no uncertainty
         hard_body_radius: Combined hard-body radius (km)
         n_samples: Number of Monte Carlo samples
         seed: Random seed for reproducibility
+        quasi_random: Use a scrambled Sobol sequence instead of pseudo-random draws
+        rng: Generator to draw from instead of seeding a new one from ``seed``
         
     Returns:
         Collision probability (0 to 1)
     """
-    rng = np.random.default_rng(seed)
+    if _is_zero_covariance(cov_combined):
+        # No uncertainty - nothing to sample
+        return 0.0
     
     # Extract position covariance (upper-left 3x3 block)
     cov_pos = cov_combined[:3, :3]
     
-    # Check for singular covariance
+    # Sample relative positions from the combined covariance
+    # Distribution is centered at rel_pos
     try:
-        # Sample relative positions from the combined covariance
-        # Distribution is centered at rel_pos
-        samples_3d = rng.multivariate_normal(rel_pos, cov_pos, size=n_samples)
+        samples_3d = _mvn_sample(rel_pos, cov_pos, n_samples, seed, quasi_random, rng)
     except np.linalg.LinAlgError:
-        # Singular covariance - cannot sample
+        # Covariance cannot be factored - cannot sample
         return 0.0
     
     # Project samples onto B-plane (perpendicular to relative velocity)
@@ -235,29 +305,54 @@ def compute_pc_monte_carlo(
     rel_vel_norm = np.linalg.norm(rel_vel) if rel_vel is not None else 0.0
     if rel_vel_norm < 1e-10:
         # Zero relative velocity - use 3D distance
-        distances = np.linalg.norm(samples_3d, axis=1)
+        offsets = samples_3d
     else:
         # Remove component along relative velocity
         z_hat = rel_vel / rel_vel_norm
         # For each sample, remove the along-track component
         along_track = np.dot(samples_3d, z_hat).reshape(-1, 1)
-        samples_bplane = samples_3d - along_track * z_hat
-        # Compute distances in B-plane
-        distances = np.linalg.norm(samples_bplane, axis=1)
+        offsets = samples_3d - along_track * z_hat
     
-    # Count collisions
-    collisions = np.sum(distances < hard_body_radius)
+    # Count collisions on squared distances (no per-sample sqrt)
+    dist_sq = np.einsum("ij,ij->i", offsets, offsets)
+    collisions = np.count_nonzero(dist_sq < hard_body_radius * hard_body_radius)
     
     return collisions / n_samples
 
 
+def _as_matrix(cov: NDArray) -> NDArray:
+    """Expand a length-6 variance vector to a diagonal 6x6 covariance."""
+    return np.diag(cov) if cov.ndim == 1 else cov
+
+
+def _as_batch_matrix(cov: NDArray | None) -> NDArray:
+    """Normalize one side of a batch covariance to (6, 6) or (N, 6, 6).
+
+    ``None`` becomes a zero matrix and a shared length-6 variance vector its
+    diagonal matrix, as in :func:`compute_pc`.
+
+    Raises:
+        ValueError: If the covariance has any other shape.
+    """
+    if cov is None:
+        return np.zeros((6, 6))
+    cov = np.asarray(cov, dtype=np.float64)
+    if cov.shape == (6,):
+        return np.diag(cov)
+    if cov.ndim in (2, 3) and cov.shape[-2:] == (6, 6):
+        return cov
+    raise ValueError(
+        f"Batch covariance must be None, (6,), (6, 6) or (N, 6, 6), got shape {cov.shape}"
+    )
+
+
 def compute_pc(
     pos1_km: NDArray,
     vel1_km_s: NDArray,
     pos2_km: NDArray,
     vel2_km_s: NDArray,
-    cov1: NDArray,
-    cov2: NDArray,
+    cov1: NDArray | None,
+    cov2: NDArray | None,
     hard_body_radius_m: float = 20.0,
     method: PcMethod = PcMethod.FOSTER_1992,
     mc_samples: int = 100_000,
@@ -269,11 +364,13 @@ def compute_pc(
         vel1_km_s: Primary velocity vector (km/s) in ECI
         pos2_km: Secondary position vector (km) in ECI
         vel2_km_s: Secondary velocity vector (km/s) in ECI
-        cov1: 6x6 covariance matrix for primary (position+velocity) in km, km/s
-        cov2: 6x6 covariance matrix for secondary (position+velocity) in km, km/s
+        cov1: 6x6 covariance matrix for primary (position+velocity) in km, km/s,
+            or its diagonal as a length-6 vector of variances; None means no uncertainty
+        cov2: 6x6 covariance matrix for secondary (position+velocity) in km, km/s,
+            or its diagonal as a length-6 vector of variances; None means no uncertainty
         hard_body_radius_m: Combined hard-body radius in meters
         method: Calculation method
-        mc_samples: Number of samples for Monte Carlo method
+        mc_samples: Number of samples for the (quasi-)Monte Carlo methods
     
     Returns:
         PcResult with collision probability and metadata
@@ -282,22 +379,127 @@ def compute_pc(
         Combined covariance = cov1 + cov2 (assuming independence).
         Hard body radius is converted from meters to km internally.
     """
-    # Convert hard body radius from meters to km
-    hard_body_radius_km = hard_body_radius_m / 1000.0
-    
     # Compute relative state
     rel_pos, rel_vel = _relative_state(pos1_km, vel1_km_s, pos2_km, vel2_km_s)
     
-    # Combined covariance (assuming independence)
-    cov_combined = cov1 + cov2
+    if _is_zero_covariance(cov1) and _is_zero_covariance(cov2):
+        # Deterministic positions: Pc is 0 without any matrix factorization
+        if not isinstance(method, PcMethod):
+            raise ValueError(f"Unknown method: {method}")
+        logger.debug("Pc computation skipped: zero covariance, method=%s", method.value)
+        sampled = method in (PcMethod.MONTE_CARLO, PcMethod.QUASI_MONTE_CARLO)
+        return PcResult(
+            probability=0.0,
+            method=method,
+            combined_hard_body_radius_m=hard_body_radius_m,
+            samples=mc_samples if sampled else None,
+        )
     
-    # Compute Mahalanobis distance
-    cov_pos = cov_combined[:3, :3]
+    cov1 = np.zeros(6) if cov1 is None else np.asarray(cov1)
+    cov2 = np.zeros(6) if cov2 is None else np.asarray(cov2)
+    if cov1.ndim == 1 and cov2.ndim == 1:
+        # Diagonal covariances: Mahalanobis distance needs no matrix inverse
+        var_combined = cov1 + cov2
+        var_pos = var_combined[:3]
+        mahalanobis = np.sqrt(np.sum(rel_pos**2 / var_pos)) if np.all(var_pos > 0) else None
+        cov_combined = np.diag(var_combined)
+    else:
+        # Combined covariance (assuming independence)
+        cov_combined = _as_matrix(cov1) + _as_matrix(cov2)
+        
+        # Compute Mahalanobis distance
+        cov_pos = cov_combined[:3, :3]
+        try:
+            cov_pos_inv = np.linalg.inv(cov_pos)
+            mahalanobis = np.sqrt(rel_pos @ cov_pos_inv @ rel_pos)
+        except np.linalg.LinAlgError:
+            mahalanobis = None
+    
+    return _pc_from_relative_state(
+        rel_pos, rel_vel, cov_combined, hard_body_radius_m, method, mc_samples, mahalanobis
+    )
+
+
+def compute_pc_batch(
+    pos1_km: NDArray,
+    vel1_km_s: NDArray,
+    pos2_km: NDArray,
+    vel2_km_s: NDArray,
+    cov1: NDArray | None,
+    cov2: NDArray | None,
+    hard_body_radius_m: float = 20.0,
+    method: PcMethod = PcMethod.FOSTER_1992,
+    mc_samples: int = 100_000,
+) -> list[PcResult]:
+    """Compute collision probability for many conjunctions at once.
+    
+    Relative states, combined covariances and Mahalanobis distances are
+    computed for the whole batch in vectorized NumPy; the per-conjunction Pc
+    kernel then runs once per row, exactly as in :func:`compute_pc`.
+    
+    Args:
+        pos1_km: Primary positions, shape (N, 3) (km)
+        vel1_km_s: Primary velocities, shape (N, 3) (km/s)
+        pos2_km: Secondary positions, shape (N, 3) (km)
+        vel2_km_s: Secondary velocities, shape (N, 3) (km/s)
+        cov1: Primary covariances, shape (N, 6, 6), or a single (6, 6) matrix,
+            length-6 variance vector or None shared by all rows
+        cov2: Secondary covariances, same forms as cov1
+        hard_body_radius_m: Combined hard-body radius in meters
+        method: Calculation method
+        mc_samples: Number of samples for the (quasi-)Monte Carlo methods
+    
+    Returns:
+        List of N PcResult objects, in input order
+    
+    Raises:
+        ValueError: If a covariance is not one of the accepted shapes.
+    """
+    # Compute relative states for the whole batch
+    rel_pos, rel_vel = _relative_state(
+        np.atleast_2d(pos1_km), np.atleast_2d(vel1_km_s),
+        np.atleast_2d(pos2_km), np.atleast_2d(vel2_km_s),
+    )
+    n = len(rel_pos)
+    
+    # Combined covariance (assuming independence), broadcast to (N, 6, 6)
+    cov_combined = np.broadcast_to(_as_batch_matrix(cov1) + _as_batch_matrix(cov2), (n, 6, 6))
+    
+    # Mahalanobis distances in one batched solve; a singular block leaves None
+    cov_pos = cov_combined[:, :3, :3]
+    mahalanobis: list[float | None] = [None] * n
     try:
-        cov_pos_inv = np.linalg.inv(cov_pos)
-        mahalanobis = np.sqrt(rel_pos @ cov_pos_inv @ rel_pos)
+        solved = np.linalg.solve(cov_pos, rel_pos[..., None])[..., 0]
+        mahalanobis = list(np.sqrt(np.einsum("ij,ij->i", rel_pos, solved)))
     except np.linalg.LinAlgError:
-        mahalanobis = None
+        # At least one singular block: fall back to per-conjunction solves
+        for i in range(n):
+            try:
+                mahalanobis[i] = np.sqrt(rel_pos[i] @ np.linalg.solve(cov_pos[i], rel_pos[i]))
+            except np.linalg.LinAlgError:
+                pass
+    
+    return [
+        _pc_from_relative_state(
+            rel_pos[i], rel_vel[i], cov_combined[i], hard_body_radius_m, method,
+            mc_samples, mahalanobis[i],
+        )
+        for i in range(n)
+    ]
+
+
+def _pc_from_relative_state(
+    rel_pos: NDArray,
+    rel_vel: NDArray,
+    cov_combined: NDArray,
+    hard_body_radius_m: float,
+    method: PcMethod,
+    mc_samples: int,
+    mahalanobis: float | None,
+) -> PcResult:
+    """Run the selected Pc method on one relative state and wrap the result."""
+    # Convert hard body radius from meters to km
+    hard_body_radius_km = hard_body_radius_m / 1000.0
     
     # Compute Pc based on method
     if method == PcMethod.FOSTER_1992:
@@ -315,10 +517,11 @@ def compute_pc(
             mahalanobis_distance=mahalanobis,
         )
     
-    elif method == PcMethod.MONTE_CARLO:
-        # Monte Carlo estimation
+    elif method in (PcMethod.MONTE_CARLO, PcMethod.QUASI_MONTE_CARLO):
+        # Monte Carlo estimation (Sobol-sequence draws for the quasi variant)
         pc = compute_pc_monte_carlo(
-            rel_pos, rel_vel, cov_combined, hard_body_radius_km, n_samples=mc_samples
+            rel_pos, rel_vel, cov_combined, hard_body_radius_km, n_samples=mc_samples,
+            quasi_random=method == PcMethod.QUASI_MONTE_CARLO,
         )
         
         logger.debug("Pc computation complete: method=%s, Pc=%.2e", method.value, pc)
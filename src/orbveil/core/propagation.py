@@ -28,12 +28,37 @@ class StateVector:
     epoch: datetime
 
 
-def propagate(tle: TLE, times: list[datetime]) -> list[StateVector]:
+# Julian date of the Unix epoch (1970-01-01T00:00:00 UTC)
+_UNIX_EPOCH_JD = 2440587.5
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def _julian_dates(
+    times: list[datetime] | NDArray[np.datetime64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Convert UTC times to SGP4 Julian dates split into whole day and fraction.
+
+    ``np.datetime64`` input (naive, taken as UTC) is converted with integer
+    arithmetic on the whole array; datetimes go through ``sgp4.api.jday``.
+    """
+    if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.datetime64):
+        ns = times.astype("datetime64[ns]").astype(np.int64)
+        days, rem = np.divmod(ns, _NS_PER_DAY)
+        return _UNIX_EPOCH_JD + days.astype(np.float64), rem / _NS_PER_DAY
+
+    return np.array(
+        [jday(t.year, t.month, t.day, t.hour, t.minute, t.second + t.microsecond / 1e6) for t in times],
+        dtype=np.float64,
+    ).T.copy()
+
+
+def propagate(tle: TLE, times: list[datetime] | NDArray[np.datetime64]) -> list[StateVector]:
     """Propagate a single TLE to multiple times using SGP4.
 
     Args:
         tle: A parsed TLE object.
-        times: List of UTC datetimes to propagate to.
+        times: List of UTC datetimes, or an array of ``np.datetime64`` (UTC),
+            to propagate to.
 
     Returns:
         List of StateVector objects, one per requested time.
@@ -41,42 +66,49 @@ def propagate(tle: TLE, times: list[datetime]) -> list[StateVector]:
     Raises:
         ValueError: If SGP4 propagation fails (error code != 0).
     """
-    result = []
-    satrec = tle.satrec
-
-    for t in times:
-        # Convert datetime to Julian date
-        jd, fr = jday(t.year, t.month, t.day, t.hour, t.minute, t.second + t.microsecond / 1e6)
-        
-        # Propagate using SGP4
-        error_code, pos, vel = satrec.sgp4(jd, fr)
-        
-        if error_code != 0:
-            logger.warning("SGP4 propagation failed for NORAD %d at %s: error code %d", tle.norad_id, t, error_code)
-            raise ValueError(
-                f"SGP4 propagation failed for NORAD {tle.norad_id} at {t}: error code {error_code}"
-            )
-        
-        result.append(
-            StateVector(
-                position_km=np.array(pos, dtype=np.float64),
-                velocity_km_s=np.array(vel, dtype=np.float64),
-                epoch=t,
-            )
+    if len(times) == 0:
+        return []
+
+    # Convert times to Julian dates (whole day + fraction)
+    jd, fr = _julian_dates(times)
+    if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.datetime64):
+        # StateVector epochs are timezone-aware datetimes
+        times = [
+            t.replace(tzinfo=timezone.utc)
+            for t in times.astype("datetime64[us]").astype(datetime)
+        ]
+
+    # Propagate all times in a single vectorized SGP4 call
+    errors, positions, velocities = tle.satrec.sgp4_array(jd, fr)
+
+    failed = np.flatnonzero(errors)
+    if failed.size:
+        t = times[failed[0]]
+        error_code = int(errors[failed[0]])
+        logger.warning("SGP4 propagation failed for NORAD %d at %s: error code %d", tle.norad_id, t, error_code)
+        raise ValueError(
+            f"SGP4 propagation failed for NORAD {tle.norad_id} at {t}: error code {error_code}"
         )
 
+    result = [
+        StateVector(position_km=pos, velocity_km_s=vel, epoch=t)
+        for pos, vel, t in zip(positions, velocities, times)
+    ]
+
     logger.debug("Propagated NORAD %d to %d times", tle.norad_id, len(times))
     return result
 
 
-def propagate_batch(tles: list[TLE], time: datetime) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+def propagate_batch(
+    tles: list[TLE], time: datetime | np.datetime64
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
     """Propagate many TLEs to a single time using vectorized SGP4.
 
     Uses SatrecArray for C-level batch propagation (fast path for large catalogs).
 
     Args:
         tles: List of TLE objects to propagate.
-        time: Single UTC datetime to propagate all objects to.
+        time: Single UTC datetime (or ``np.datetime64``) to propagate all objects to.
 
     Returns:
         Tuple of:
@@ -90,12 +122,11 @@ def propagate_batch(tles: list[TLE], time: datetime) -> tuple[NDArray[np.float64
     satrecs = [tle.satrec for tle in tles]
     satrec_array = SatrecArray(satrecs)
 
-    # Convert time to Julian date
-    jd, fr = jday(time.year, time.month, time.day, time.hour, time.minute, time.second + time.microsecond / 1e6)
-    
-    # Convert to numpy arrays (SatrecArray requires arrays, not scalars)
-    jd_array = np.array([jd], dtype=np.float64)
-    fr_array = np.array([fr], dtype=np.float64)
+    # Convert time to Julian date arrays (SatrecArray requires arrays, not scalars)
+    if isinstance(time, np.datetime64):
+        jd_array, fr_array = _julian_dates(np.array([time]))
+    else:
+        jd_array, fr_array = _julian_dates([time])
 
     # Batch propagate
     # Output shape: errors (n,1), positions (n,1,3), velocities (n,1,3)
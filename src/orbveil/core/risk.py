@@ -4,18 +4,50 @@ import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Risk multiplier per RCS size category (built once, not per assessment)
+_SIZE_WEIGHTS = {
+    "SMALL": 0.8,
+    "MEDIUM": 1.0,
+    "LARGE": 1.3,
+    "UNKNOWN": 1.0,
+}
+
+# Distance score decay constant (1/km) and velocity at which the velocity score saturates
+_DISTANCE_DECAY_PER_KM = 0.15
+_MAX_VELOCITY_KM_S = 10.0
+
+# Event dict keys accepted by classify_events (the assess_risk parameters)
+_REQUIRED_EVENT_KEYS = frozenset({"miss_distance_km", "relative_velocity_km_s"})
+_EVENT_KEYS = _REQUIRED_EVENT_KEYS | {
+    "obj1_rcs", "obj2_rcs", "obj1_maneuverable", "obj2_maneuverable", "tca", "now",
+}
+
+
+class RiskFactors(NamedTuple):
+    """Breakdown of the factors behind a risk score (each rounded to 2 decimals)."""
 
-@dataclass
+    distance_score: float
+    velocity_score: float
+    size_multiplier: float
+    maneuver_multiplier: float
+    urgency_multiplier: float
+    base_score: float
+
+
+@dataclass(slots=True)
 class RiskAssessment:
     score: float          # 0-100
     category: str         # CRITICAL/HIGH/MEDIUM/LOW/NEGLIGIBLE
     miss_distance_km: float
     relative_velocity_km_s: float
     time_to_tca_hours: float | None
-    factors: dict         # breakdown of contributing factors
+    factors: RiskFactors  # breakdown of contributing factors
     recommendation: str   # human-readable action recommendation
 
 
@@ -44,9 +76,33 @@ def assess_risk(
     Returns:
         RiskAssessment with score, category, and recommendation
     """
-    # Calculate individual risk factors
-    distance_score = _calculate_distance_score(miss_distance_km)
-    velocity_score = _calculate_velocity_score(relative_velocity_km_s)
+    return _build_assessment(
+        miss_distance_km,
+        relative_velocity_km_s,
+        _calculate_distance_score(miss_distance_km),
+        _calculate_velocity_score(relative_velocity_km_s),
+        obj1_rcs,
+        obj2_rcs,
+        obj1_maneuverable,
+        obj2_maneuverable,
+        tca,
+        now,
+    )
+
+
+def _build_assessment(
+    miss_distance_km: float,
+    relative_velocity_km_s: float,
+    distance_score: float,
+    velocity_score: float,
+    obj1_rcs: str,
+    obj2_rcs: str,
+    obj1_maneuverable: bool,
+    obj2_maneuverable: bool,
+    tca: datetime | None,
+    now: datetime | None,
+) -> RiskAssessment:
+    """Apply the multipliers to precomputed distance/velocity scores and build the result."""
     size_multiplier = _calculate_size_multiplier(obj1_rcs, obj2_rcs)
     maneuver_multiplier = _calculate_maneuver_multiplier(obj1_maneuverable, obj2_maneuverable)
     time_to_tca_hours = None
@@ -79,14 +135,14 @@ def assess_risk(
     recommendation = _generate_recommendation(category, obj1_maneuverable, obj2_maneuverable)
     
     # Build factor breakdown
-    factors = {
-        "distance_score": round(distance_score, 2),
-        "velocity_score": round(velocity_score, 2),
-        "size_multiplier": round(size_multiplier, 2),
-        "maneuver_multiplier": round(maneuver_multiplier, 2),
-        "urgency_multiplier": round(urgency_multiplier, 2),
-        "base_score": round(base_score, 2),
-    }
+    factors = RiskFactors(
+        distance_score=round(distance_score, 2),
+        velocity_score=round(velocity_score, 2),
+        size_multiplier=round(size_multiplier, 2),
+        maneuver_multiplier=round(maneuver_multiplier, 2),
+        urgency_multiplier=round(urgency_multiplier, 2),
+        base_score=round(base_score, 2),
+    )
     
     logger.debug("Risk assessment: score=%.2f, category=%s, miss=%.3f km", final_score, category, miss_distance_km)
     return RiskAssessment(
@@ -104,13 +160,55 @@ def classify_events(events: list[dict]) -> list[RiskAssessment]:
     """
     Batch classify a list of conjunction events.
     
+    Distance and velocity scores are computed for the whole batch with NumPy;
+    multipliers, categories and recommendations are then applied per event
+    exactly as in assess_risk.
+    
     Args:
         events: List of event dictionaries with keys matching assess_risk parameters
     
     Returns:
         List of RiskAssessment objects
+    
+    Raises:
+        TypeError: If an event has an unknown key or lacks a required one
     """
-    return [assess_risk(**event) for event in events]
+    if not events:
+        return []
+    
+    for event in events:
+        unknown = event.keys() - _EVENT_KEYS
+        if unknown:
+            raise TypeError(f"Unexpected event keys: {sorted(unknown)}")
+        missing = _REQUIRED_EVENT_KEYS - event.keys()
+        if missing:
+            raise TypeError(f"Event missing required keys: {sorted(missing)}")
+    
+    miss = np.array([event["miss_distance_km"] for event in events], dtype=np.float64)
+    velocity = np.array([event["relative_velocity_km_s"] for event in events], dtype=np.float64)
+    distance_scores = 100 * np.exp(-_DISTANCE_DECAY_PER_KM * np.maximum(miss, 0.0))
+    velocity_scores = np.minimum(100.0, (np.maximum(velocity, 0.0) / _MAX_VELOCITY_KM_S) * 100)
+    
+    # Read the clock at most once for the whole batch
+    now = None
+    if any(event.get("tca") is not None and event.get("now") is None for event in events):
+        now = datetime.now(timezone.utc)
+    
+    return [
+        _build_assessment(
+            event["miss_distance_km"],
+            event["relative_velocity_km_s"],
+            float(distance_score),
+            float(velocity_score),
+            event.get("obj1_rcs", "UNKNOWN"),
+            event.get("obj2_rcs", "UNKNOWN"),
+            event.get("obj1_maneuverable", False),
+            event.get("obj2_maneuverable", False),
+            event.get("tca"),
+            event.get("now") or now,
+        )
+        for event, distance_score, velocity_score in zip(events, distance_scores, velocity_scores)
+    ]
 
 
 def _calculate_distance_score(miss_distance_km: float) -> float:
@@ -124,8 +222,7 @@ def _calculate_distance_score(miss_distance_km: float) -> float:
     # Exponential decay: score = 100 * e^(-k * distance)
     # At 1 km, we want high score (~90)
     # At 25 km, we want low score (~5)
-    k = 0.15  # decay constant (increased for steeper drop-off)
-    score = 100 * math.exp(-k * miss_distance_km)
+    score = 100 * math.exp(-_DISTANCE_DECAY_PER_KM * miss_distance_km)
     
     return score
 
@@ -140,8 +237,7 @@ def _calculate_velocity_score(relative_velocity_km_s: float) -> float:
         relative_velocity_km_s = 0
     
     # Normalize to 0-100, with 10 km/s as max
-    max_velocity = 10.0
-    score = min(100.0, (relative_velocity_km_s / max_velocity) * 100)
+    score = min(100.0, (relative_velocity_km_s / _MAX_VELOCITY_KM_S) * 100)
     
     return score
 
@@ -151,15 +247,8 @@ def _calculate_size_multiplier(obj1_rcs: str, obj2_rcs: str) -> float:
     Calculate size-based risk multiplier.
     Larger objects present greater collision risk.
     """
-    size_weights = {
-        "SMALL": 0.8,
-        "MEDIUM": 1.0,
-        "LARGE": 1.3,
-        "UNKNOWN": 1.0,
-    }
-    
-    weight1 = size_weights.get(obj1_rcs.upper(), 1.0)
-    weight2 = size_weights.get(obj2_rcs.upper(), 1.0)
+    weight1 = _SIZE_WEIGHTS.get(obj1_rcs.upper(), 1.0)
+    weight2 = _SIZE_WEIGHTS.get(obj2_rcs.upper(), 1.0)
     
     # Use the maximum weight (worst case)
     return max(weight1, weight2)
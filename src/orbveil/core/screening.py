@@ -11,11 +11,13 @@ from sgp4.api import Satrec, SatrecArray, jday
 from scipy.spatial import cKDTree
 
 from orbveil.core.tle import TLE
-from orbveil.core.propagation import propagate_batch
 from orbveil.utils.constants import EARTH_MU_KM3_S2 as MU, EARTH_RADIUS_KM as RE
 
 logger = logging.getLogger(__name__)
 
+# Coarse-search time steps propagated per SatrecArray call in screen()
+_SCREEN_TIME_CHUNK = 256
+
 
 @dataclass
 class ConjunctionEvent:
@@ -131,34 +133,42 @@ def screen(
         step_delta = timedelta(minutes=step_minutes)
 
         # C2 fix: batch primary + candidates together
-        batch_tles = [prim] + candidates
+        batch_array = SatrecArray([prim.satrec] + [c.satrec for c in candidates])
         potential_windows: dict[int, list[tuple[datetime, float, NDArray]]] = {}
 
+        # Coarse time grid (same instants as stepping start_time by step_delta)
+        times = []
         current_time = start_time
         while current_time <= end_time:
-            states, valid = propagate_batch(batch_tles, current_time)
-            if not valid[0]:
-                current_time += step_delta
-                continue
-
-            prim_pos = states[0, 0:3]
+            times.append(current_time)
+            current_time += step_delta
 
-            for i, cand in enumerate(candidates):
+        for chunk_start in range(0, len(times), _SCREEN_TIME_CHUNK):
+            chunk = times[chunk_start:chunk_start + _SCREEN_TIME_CHUNK]
+            jd, fr = np.array(
+                [jday(t.year, t.month, t.day, t.hour, t.minute, t.second + t.microsecond / 1e6) for t in chunk],
+                dtype=np.float64,
+            ).T.copy()
+
+            # One C call for every object and time step in the chunk:
+            # errors (n, T), positions (n, T, 3), velocities (n, T, 3)
+            errors, positions, velocities = batch_array.sgp4(jd, fr)
+            valid = errors == 0
+
+            # Distance from every candidate to the primary at every step, shape (n-1, T)
+            distances = np.linalg.norm(positions[1:] - positions[0:1], axis=-1)
+            close = (distances <= threshold_km) & valid[1:] & valid[0:1]
+
+            # Transpose so detections are visited time-major, candidate-minor
+            for t_idx, i in zip(*np.nonzero(close.T)):
+                cand = candidates[i]
                 idx = i + 1  # offset by 1 since primary is at index 0
-                if not valid[idx]:
-                    continue
-
-                cand_pos = states[idx, 0:3]
-                distance = float(np.linalg.norm(prim_pos - cand_pos))
-
-                if distance <= threshold_km:
-                    if cand.norad_id not in potential_windows:
-                        potential_windows[cand.norad_id] = []
-                    potential_windows[cand.norad_id].append(
-                        (current_time, distance, states[idx, :])
-                    )
-
-            current_time += step_delta
+                if cand.norad_id not in potential_windows:
+                    potential_windows[cand.norad_id] = []
+                potential_windows[cand.norad_id].append(
+                    (chunk[t_idx], float(distances[i, t_idx]),
+                     np.concatenate((positions[idx, t_idx], velocities[idx, t_idx])))
+                )
 
         # Step 3: Refine each potential conjunction
         for sec_norad_id, windows in potential_windows.items():
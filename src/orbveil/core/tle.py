@@ -106,6 +106,17 @@ class TLE:
             satrec=sat,
         )
 
+    def __getstate__(self) -> dict[str, object]:
+        # Satrec is a C extension type that cannot be pickled; it is rebuilt
+        # from the raw lines on unpickling.
+        state = self.__dict__.copy()
+        del state["satrec"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        object.__setattr__(self, "satrec", Satrec.twoline2rv(self.line1, self.line2, WGS72))
+
     def __str__(self) -> str:
         header = f"0 {self.name}\n" if self.name else ""
         return f"{header}{self.line1}\n{self.line2}"
@@ -17,6 +17,9 @@ import numpy as np
 logger = logging.getLogger(__name__)
 from numpy.typing import NDArray
 
+# KEY = value [units]; the optional trailing unit annotation is dropped
+_KVN_LINE_RE = re.compile(r"^\s*(\w+)\s*=\s*(.*?)\s*(?:\[[^\]]*\])?\s*$")
+
 
 @dataclass
 class CDMObject:
@@ -67,21 +70,27 @@ class CDM:
         Raises:
             ValueError: If the CDM is malformed or missing required fields.
         """
-        lines = text.strip().splitlines()
         data: dict[str, str] = {}
-        
-        # Parse key-value pairs
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("COMMENT"):
+        # Per-object fields follow their OBJECT = OBJECT1/OBJECT2 marker
+        obj1_data: dict[str, str] = {}
+        obj2_data: dict[str, str] = {}
+        current_obj = None
+
+        # Parse key-value pairs in a single pass
+        for line in text.splitlines():
+            match = _KVN_LINE_RE.match(line)
+            if match is None:
+                continue
+            key, value = match.groups()
+            if key == "COMMENT":
                 continue
-            if "=" in line:
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip()
-                # Remove units in brackets
-                value = re.sub(r'\s*\[.*?\]\s*', '', value)
-                data[key] = value
+            data[key] = value
+            if key == "OBJECT":
+                current_obj = value
+            elif current_obj == "OBJECT1":
+                obj1_data[key] = value
+            elif current_obj == "OBJECT2":
+                obj2_data[key] = value
 
         # Parse header fields
         try:
@@ -105,32 +114,6 @@ class CDM:
             logger.error("Missing or invalid required CDM header field: %s", e)
             raise ValueError(f"Missing or invalid required CDM header field: {e}")
 
-        # Parse objects - need to split data by OBJECT marker
-        obj1_data: dict[str, str] = {}
-        obj2_data: dict[str, str] = {}
-        current_obj = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if "OBJECT" in line and "=" in line:
-                key, _, value = line.partition("=")
-                if key.strip() == "OBJECT":
-                    current_obj = value.strip()
-                    continue
-            
-            if "=" in line and current_obj:
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip()
-                value = re.sub(r'\s*\[.*?\]\s*', '', value)
-                
-                if current_obj == "OBJECT1":
-                    obj1_data[key] = value
-                elif current_obj == "OBJECT2":
-                    obj2_data[key] = value
-
         # Parse each object
         try:
             object1 = _parse_cdm_object(obj1_data)
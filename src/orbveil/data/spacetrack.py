@@ -6,7 +6,9 @@ TLEs, conjunction data messages, and satellite metadata.
 
 from __future__ import annotations
 
+import io
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 import requests
@@ -181,23 +183,33 @@ class SpaceTrackClient:
         if not response_text.strip():
             return []
         
-        # Split multiple CDMs (each starts with CCSDS_CDM_VERS)
+        # Each CDM starts with CCSDS_CDM_VERS; parse them one at a time
         cdms: list[CDM] = []
-        cdm_texts = response_text.split("CCSDS_CDM_VERS")
-        
-        for i, cdm_text in enumerate(cdm_texts):
-            if not cdm_text.strip():
-                continue
-            
-            # Restore the split header
-            if i > 0:
-                cdm_text = "CCSDS_CDM_VERS" + cdm_text
-            
+        for cdm_text in _iter_cdm_texts(response_text):
             try:
-                cdm = CDM.from_kvn(cdm_text)
-                cdms.append(cdm)
-            except (ValueError, KeyError) as e:
+                cdms.append(CDM.from_kvn(cdm_text))
+            except (ValueError, KeyError):
                 # Skip malformed CDMs
                 continue
-        
+
         return cdms
+
+
+def _iter_cdm_texts(text: str) -> Iterator[str]:
+    """Yield the individual CDMs of a multi-CDM KVN response.
+
+    Lines are streamed from the response and a new message is started at
+    every ``CCSDS_CDM_VERS`` header, so only one CDM is buffered at a time.
+    """
+    buf: list[str] = []
+    for line in io.StringIO(text):
+        if line.lstrip().startswith("CCSDS_CDM_VERS") and buf:
+            chunk = "".join(buf)
+            if chunk.strip():
+                yield chunk
+            buf = []
+        buf.append(line)
+
+    chunk = "".join(buf)
+    if chunk.strip():
+        yield chunk
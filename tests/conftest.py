@@ -0,0 +1,94 @@
+"""Shared pytest configuration for the OrbVeil test suite."""
+from __future__ import annotations
+
+import zlib
+
+import numpy as np
+import pytest
+
+from orbveil.core.propagation import propagate_batch
+from orbveil.core.tle import TLE
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip ``@pytest.mark.slow`` tests unless ``--runslow`` is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def mc_seed(request: pytest.FixtureRequest) -> int:
+    """Per-test Monte Carlo seed derived from the test's node ID.
+
+    Each test gets its own random stream, and the seed does not depend on
+    which ``pytest -n`` worker runs it, so parallel runs stay reproducible.
+    """
+    return zlib.crc32(request.node.nodeid.encode())
+
+
+# Reference TLEs shared by the test modules; each is parsed once per session
+ISS_TLE_LINES = (
+    "1 25544U 98067A   24045.54896019  .00016717  00000-0  30093-3 0  9993",
+    "2 25544  51.6412 207.4925 0004948 290.5508 178.9792 15.49583488439596",
+)
+
+CSS_TLE_LINES = (
+    "1 48274U 21035A   24045.50261574  .00021540  00000-0  25163-3 0  9993",
+    "2 48274  41.4681 279.1498 0005372 149.8847 345.3740 15.62096269157018",
+)
+
+HUBBLE_TLE_LINES = (
+    "1 20580U 90037B   24045.55478014  .00001456  00000-0  73052-4 0  9994",
+    "2 20580  28.4701  41.0696 0002622 348.3544 140.2428 15.09435694872912",
+)
+
+GEO_TLE_LINES = (
+    "1 36516U 10012A   24045.39583333  .00000112  00000-0  00000+0 0  9991",
+    "2 36516   0.0254 268.0254 0000567 142.5432 240.3076  1.00271953 50780",
+)
+
+
+@pytest.fixture(scope="session")
+def iss_tle() -> TLE:
+    """ISS TLE for testing."""
+    return TLE.from_lines(ISS_TLE_LINES[0], ISS_TLE_LINES[1], "ISS (ZARYA)")
+
+
+@pytest.fixture(scope="session")
+def css_tle() -> TLE:
+    """Chinese Space Station (Tiangong) TLE for testing."""
+    return TLE.from_lines(CSS_TLE_LINES[0], CSS_TLE_LINES[1], "CSS (TIANHE)")
+
+
+@pytest.fixture(scope="session")
+def hubble_tle() -> TLE:
+    """Hubble Space Telescope TLE for testing."""
+    return TLE.from_lines(HUBBLE_TLE_LINES[0], HUBBLE_TLE_LINES[1], "HUBBLE")
+
+
+@pytest.fixture(scope="session")
+def geo_tle() -> TLE:
+    """GEO satellite TLE for testing."""
+    return TLE.from_lines(GEO_TLE_LINES[0], GEO_TLE_LINES[1], "SES-1")
+
+
+@pytest.fixture(scope="module")
+def batch_states(
+    iss_tle: TLE, css_tle: TLE, hubble_tle: TLE, geo_tle: TLE
+) -> tuple[np.ndarray, np.ndarray]:
+    """``(states, valid)`` for ISS, CSS, Hubble and GEO propagated to the ISS epoch.
+
+    Rows follow that order; tests slice the rows they need instead of
+    propagating the reference catalog again.
+    """
+    return propagate_batch([iss_tle, css_tle, hubble_tle, geo_tle], iss_tle.epoch)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import reduce
 
 import numpy as np
 import pytest
@@ -243,52 +244,67 @@ SAMPLE_CDM_XML = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
-def test_cdm_kvn_parsing():
+def _drop_kvn_keys(text: str, keys: frozenset[str]) -> str:
+    """Return ``text`` without the KVN lines whose key is in ``keys``."""
+    return "\n".join(
+        line for line in text.splitlines()
+        if line.partition("=")[0].strip() not in keys
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_cdm() -> CDM:
+    """SAMPLE_CDM_KVN parsed once and shared across the module."""
+    return CDM.from_kvn(SAMPLE_CDM_KVN)
+
+
+def _get(obj: object, path: str) -> object:
+    """Resolve a dotted attribute path such as ``object1.name``."""
+    return reduce(getattr, path.split("."), obj)
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        # Header fields
+        ("ccsds_cdm_vers", "1.0"),
+        ("originator", "JSPOC"),
+        ("message_id", "25544_conj_48274_20240214_120000"),
+        # Datetime parsing
+        ("creation_date", datetime(2024, 2, 14, 12, 0, 0, tzinfo=timezone.utc)),
+        ("tca", datetime(2024, 2, 15, 8, 30, 15, 555000, tzinfo=timezone.utc)),
+        # Screening metrics
+        ("miss_distance_km", 0.523),
+        ("relative_speed_km_s", 14.234),
+        ("collision_probability", pytest.approx(1.23e-05)),
+        # Object 1 (ISS)
+        ("object1.designator", "25544"),
+        ("object1.name", "ISS (ZARYA)"),
+        ("object1.international_designator", "1998-067A"),
+        ("object1.maneuverable", "YES"),
+        ("object1.covariance_method", "CALCULATED"),
+        ("object1.x_km", pytest.approx(2345.678)),
+        ("object1.y_km", pytest.approx(4567.890)),
+        ("object1.z_km", pytest.approx(3456.789)),
+        ("object1.x_dot_km_s", pytest.approx(5.123)),
+        ("object1.y_dot_km_s", pytest.approx(4.567)),
+        ("object1.z_dot_km_s", pytest.approx(2.345)),
+        # Object 2 (debris)
+        ("object2.designator", "48274"),
+        ("object2.name", "COSMOS 2251 DEB"),
+        ("object2.international_designator", "1993-036JKL"),
+        ("object2.maneuverable", "NO"),
+        ("object2.x_km", pytest.approx(2345.156)),
+        ("object2.y_km", pytest.approx(4567.412)),
+        ("object2.z_km", pytest.approx(3456.558)),
+        ("object2.x_dot_km_s", pytest.approx(-4.856)),
+        ("object2.y_dot_km_s", pytest.approx(-3.987)),
+        ("object2.z_dot_km_s", pytest.approx(-2.123)),
+    ],
+)
+def test_cdm_kvn_parsing(sample_cdm, path, expected):
     """Test CDM KVN parsing with realistic fixture."""
-    cdm = CDM.from_kvn(SAMPLE_CDM_KVN)
-    
-    # Check header fields
-    assert cdm.ccsds_cdm_vers == "1.0"
-    assert cdm.originator == "JSPOC"
-    assert cdm.message_id == "25544_conj_48274_20240214_120000"
-    
-    # Check datetime parsing
-    assert cdm.creation_date == datetime(2024, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
-    assert cdm.tca == datetime(2024, 2, 15, 8, 30, 15, 555000, tzinfo=timezone.utc)
-    
-    # Check screening metrics
-    assert cdm.miss_distance_km == 0.523
-    assert cdm.relative_speed_km_s == 14.234
-    assert cdm.collision_probability == pytest.approx(1.23e-05)
-    
-    # Check object 1 (ISS)
-    assert cdm.object1.designator == "25544"
-    assert cdm.object1.name == "ISS (ZARYA)"
-    assert cdm.object1.international_designator == "1998-067A"
-    assert cdm.object1.maneuverable == "YES"
-    assert cdm.object1.covariance_method == "CALCULATED"
-    
-    # Check object 1 state vector
-    assert cdm.object1.x_km == pytest.approx(2345.678)
-    assert cdm.object1.y_km == pytest.approx(4567.890)
-    assert cdm.object1.z_km == pytest.approx(3456.789)
-    assert cdm.object1.x_dot_km_s == pytest.approx(5.123)
-    assert cdm.object1.y_dot_km_s == pytest.approx(4.567)
-    assert cdm.object1.z_dot_km_s == pytest.approx(2.345)
-    
-    # Check object 2 (debris)
-    assert cdm.object2.designator == "48274"
-    assert cdm.object2.name == "COSMOS 2251 DEB"
-    assert cdm.object2.international_designator == "1993-036JKL"
-    assert cdm.object2.maneuverable == "NO"
-    
-    # Check object 2 state vector
-    assert cdm.object2.x_km == pytest.approx(2345.156)
-    assert cdm.object2.y_km == pytest.approx(4567.412)
-    assert cdm.object2.z_km == pytest.approx(3456.558)
-    assert cdm.object2.x_dot_km_s == pytest.approx(-4.856)
-    assert cdm.object2.y_dot_km_s == pytest.approx(-3.987)
-    assert cdm.object2.z_dot_km_s == pytest.approx(-2.123)
+    assert _get(sample_cdm, path) == expected
 
 
 def test_cdm_covariance_matrix():
@@ -305,10 +321,10 @@ def test_cdm_covariance_matrix():
     
     # Check symmetry
     cov1 = cdm.object1.covariance
-    assert np.allclose(cov1, cov1.T), "Object 1 covariance must be symmetric"
+    assert (cov1 == cov1.T).all(), "Object 1 covariance must be symmetric"
     
     cov2 = cdm.object2.covariance
-    assert np.allclose(cov2, cov2.T), "Object 2 covariance must be symmetric"
+    assert (cov2 == cov2.T).all(), "Object 2 covariance must be symmetric"
     
     # Check specific values (diagonal and a few off-diagonal)
     # Object 1
@@ -352,95 +368,7 @@ def test_cdm_xml_parsing():
     # Check covariance exists and is symmetric
     assert cdm.object1.covariance is not None
     assert cdm.object1.covariance.shape == (6, 6)
-    assert np.allclose(cdm.object1.covariance, cdm.object1.covariance.T)
-
-
-def test_cdm_missing_collision_probability():
-    """Test CDM parsing when collision_probability is absent."""
-    cdm_text = """CCSDS_CDM_VERS               = 1.0
-CREATION_DATE                = 2024-02-14T12:00:00.000
-ORIGINATOR                   = JSPOC
-MESSAGE_ID                   = TEST_NO_PROB
-TCA                          = 2024-02-15T08:30:15.555
-MISS_DISTANCE                = 0.523
-RELATIVE_SPEED               = 14.234
-
-OBJECT                       = OBJECT1
-OBJECT_DESIGNATOR            = 25544
-OBJECT_NAME                  = TEST_SAT_1
-INTERNATIONAL_DESIGNATOR     = 1998-067A
-EPHEMERIS_NAME               = NONE
-COVARIANCE_METHOD            = CALCULATED
-MANEUVERABLE                 = YES
-X                            = 2345.678
-Y                            = 4567.890
-Z                            = 3456.789
-X_DOT                        = 5.123
-Y_DOT                        = 4.567
-Z_DOT                        = 2.345
-
-OBJECT                       = OBJECT2
-OBJECT_DESIGNATOR            = 48274
-OBJECT_NAME                  = TEST_SAT_2
-INTERNATIONAL_DESIGNATOR     = 1993-036A
-EPHEMERIS_NAME               = NONE
-COVARIANCE_METHOD            = CALCULATED
-MANEUVERABLE                 = NO
-X                            = 2345.156
-Y                            = 4567.412
-Z                            = 3456.558
-X_DOT                        = -4.856
-Y_DOT                        = -3.987
-Z_DOT                        = -2.123
-"""
-    
-    cdm = CDM.from_kvn(cdm_text)
-    assert cdm.collision_probability is None
-
-
-def test_cdm_missing_covariance():
-    """Test CDM parsing when covariance is absent."""
-    cdm_text = """CCSDS_CDM_VERS               = 1.0
-CREATION_DATE                = 2024-02-14T12:00:00
-ORIGINATOR                   = JSPOC
-MESSAGE_ID                   = TEST_NO_COV
-TCA                          = 2024-02-15T08:30:15
-MISS_DISTANCE                = 0.523
-RELATIVE_SPEED               = 14.234
-COLLISION_PROBABILITY        = 1.23e-05
-
-OBJECT                       = OBJECT1
-OBJECT_DESIGNATOR            = 25544
-OBJECT_NAME                  = TEST_SAT_1
-INTERNATIONAL_DESIGNATOR     = 1998-067A
-EPHEMERIS_NAME               = NONE
-COVARIANCE_METHOD            = CALCULATED
-MANEUVERABLE                 = YES
-X                            = 2345.678
-Y                            = 4567.890
-Z                            = 3456.789
-X_DOT                        = 5.123
-Y_DOT                        = 4.567
-Z_DOT                        = 2.345
-
-OBJECT                       = OBJECT2
-OBJECT_DESIGNATOR            = 48274
-OBJECT_NAME                  = TEST_SAT_2
-INTERNATIONAL_DESIGNATOR     = 1993-036A
-EPHEMERIS_NAME               = NONE
-COVARIANCE_METHOD            = CALCULATED
-MANEUVERABLE                 = NO
-X                            = 2345.156
-Y                            = 4567.412
-Z                            = 3456.558
-X_DOT                        = -4.856
-Y_DOT                        = -3.987
-Z_DOT                        = -2.123
-"""
-    
-    cdm = CDM.from_kvn(cdm_text)
-    assert cdm.object1.covariance is None
-    assert cdm.object2.covariance is None
+    assert (cdm.object1.covariance == cdm.object1.covariance.T).all()
 
 
 def test_spacetrack_client_init():
@@ -479,50 +407,27 @@ def test_cdm_to_kvn_raises_not_implemented():
         cdm.to_kvn()
 
 
-def test_cdm_missing_optional_fields_still_parses():
-    """Test CDM with missing optional fields (no covariance, no collision prob)."""
-    cdm_text = """CCSDS_CDM_VERS               = 1.0
-CREATION_DATE                = 2024-02-14T12:00:00
-ORIGINATOR                   = TEST
-MESSAGE_ID                   = MINIMAL_CDM
-TCA                          = 2024-02-15T08:30:15
-MISS_DISTANCE                = 1.0
-RELATIVE_SPEED               = 7.0
-
-OBJECT                       = OBJECT1
-OBJECT_DESIGNATOR            = 11111
-OBJECT_NAME                  = SAT_A
-INTERNATIONAL_DESIGNATOR     = 2000-001A
-EPHEMERIS_NAME               = NONE
-COVARIANCE_METHOD            = CALCULATED
-MANEUVERABLE                 = YES
-X                            = 7000.0
-Y                            = 0.0
-Z                            = 0.0
-X_DOT                        = 0.0
-Y_DOT                        = 7.5
-Z_DOT                        = 0.0
-
-OBJECT                       = OBJECT2
-OBJECT_DESIGNATOR            = 22222
-OBJECT_NAME                  = SAT_B
-INTERNATIONAL_DESIGNATOR     = 2000-002A
-EPHEMERIS_NAME               = NONE
-COVARIANCE_METHOD            = CALCULATED
-MANEUVERABLE                 = NO
-X                            = 7001.0
-Y                            = 0.0
-Z                            = 0.0
-X_DOT                        = 0.0
-Y_DOT                        = -7.5
-Z_DOT                        = 0.0
-"""
-    cdm = CDM.from_kvn(cdm_text)
-    assert cdm.collision_probability is None
-    assert cdm.object1.covariance is None
-    assert cdm.object2.covariance is None
-    assert cdm.object1.designator == "11111"
-    assert cdm.object2.designator == "22222"
+@pytest.mark.parametrize(
+    "dropped",
+    [
+        frozenset(),
+        frozenset({"COLLISION_PROBABILITY"}),
+        frozenset({"COLLISION_PROBABILITY", "COLLISION_PROBABILITY_METHOD"}),
+        frozenset({"CR_R"}),
+        frozenset({"COLLISION_PROBABILITY", "CR_R"}),
+        frozenset({"MESSAGE_FOR", "OBJECT_NAME", "EPHEMERIS_NAME", "MANEUVERABLE"}),
+        frozenset({"COVARIANCE_METHOD", "INTERNATIONAL_DESIGNATOR", "CR_R"}),
+    ],
+    ids=lambda keys: "+".join(sorted(keys)) or "none",
+)
+def test_cdm_missing_optional_fields_still_parses(dropped):
+    """Test CDM parsing when optional KVN keys are removed from the sample."""
+    cdm = CDM.from_kvn(_drop_kvn_keys(SAMPLE_CDM_KVN, dropped))
+    assert (cdm.collision_probability is None) == ("COLLISION_PROBABILITY" in dropped)
+    assert (cdm.object1.covariance is None) == ("CR_R" in dropped)
+    assert (cdm.object2.covariance is None) == ("CR_R" in dropped)
+    assert cdm.object1.designator == "25544"
+    assert cdm.object2.designator == "48274"
 
 
 def test_cdm_datetime_is_utc_aware():
@@ -542,6 +447,11 @@ ISS_TLE_TEXT = (
     "1 25544U 98067A   24045.54896019  .00016717  00000-0  30093-3 0  9993\n"
     "2 25544  51.6412 207.4925 0004948 290.5508 178.9792 15.49583488439596\n"
 )
+_TWO_ISS_TLE = ISS_TLE_TEXT * 2
+
+
+def _noop() -> None:
+    """Stand-in for ``raise_for_status`` on successful responses."""
 
 
 def _make_response(status_code: int = 200, text: str = "") -> MagicMock:
@@ -549,10 +459,11 @@ def _make_response(status_code: int = 200, text: str = "") -> MagicMock:
     resp = MagicMock()
     resp.status_code = status_code
     resp.text = text
-    resp.raise_for_status = MagicMock()
-    if status_code >= 400:
-        resp.raise_for_status.side_effect = __import__("requests").HTTPError(
-            response=resp
+    if status_code < 400:
+        resp.raise_for_status = _noop
+    else:
+        resp.raise_for_status = MagicMock(
+            side_effect=__import__("requests").HTTPError(response=resp)
         )
     return resp
 
@@ -593,9 +504,8 @@ def test_fetch_tle_auth_failure_reauth():
 def test_fetch_catalog_success():
     """Test fetch_catalog returns list of TLEs."""
     client = SpaceTrackClient(identity="user", password="pass")
-    two_tles = ISS_TLE_TEXT + ISS_TLE_TEXT  # two copies
     with patch.object(client._session, "post", return_value=_make_response(200, "OK")):
-        with patch.object(client._session, "get", return_value=_make_response(200, two_tles)):
+        with patch.object(client._session, "get", return_value=_make_response(200, _TWO_ISS_TLE)):
             tles = client.fetch_catalog()
             assert len(tles) == 2
 
@@ -619,6 +529,21 @@ def test_fetch_cdms_success():
             assert cdms[0].object1.designator == "25544"
 
 
+def test_fetch_cdms_multiple():
+    """Test fetch_cdms splits a multi-CDM response into individual CDMs."""
+    client = SpaceTrackClient(identity="user", password="pass")
+    two_cdms = SAMPLE_CDM_KVN + "\n" + SAMPLE_CDM_KVN.replace(
+        "25544_conj_48274_20240214_120000", "25544_conj_48274_20240214_180000"
+    )
+    with patch.object(client._session, "post", return_value=_make_response(200, "OK")):
+        with patch.object(client._session, "get", return_value=_make_response(200, two_cdms)):
+            cdms = client.fetch_cdms(norad_id=25544)
+            assert [c.message_id for c in cdms] == [
+                "25544_conj_48274_20240214_120000",
+                "25544_conj_48274_20240214_180000",
+            ]
+
+
 def test_fetch_cdms_empty():
     """Test fetch_cdms returns empty list on empty response."""
     client = SpaceTrackClient(identity="user", password="pass")
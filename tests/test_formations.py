@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import fields
+
+import numpy as np
 import pytest
 from orbveil.core.formations import (
     FormationGroup,
@@ -69,16 +72,16 @@ class TestFormationDetection:
         norad_ids = [10001, 10002, 10003]
         
         # SAT-A and SAT-B are close with low relative velocity
-        positions = [
-            (7000.0, 0.0, 0.0),      # SAT-A
-            (7002.0, 0.0, 0.0),      # SAT-B (2 km away)
-            (8000.0, 0.0, 0.0),      # SAT-C (far away)
-        ]
-        velocities = [
-            (0.0, 7.5, 0.0),         # SAT-A
-            (0.0, 7.52, 0.0),        # SAT-B (rel vel = 0.02 km/s)
-            (0.0, 7.0, 0.0),         # SAT-C
-        ]
+        positions = np.array([
+            [7000.0, 0.0, 0.0],      # SAT-A
+            [7002.0, 0.0, 0.0],      # SAT-B (2 km away)
+            [8000.0, 0.0, 0.0],      # SAT-C (far away)
+        ])
+        velocities = np.array([
+            [0.0, 7.5, 0.0],         # SAT-A
+            [0.0, 7.52, 0.0],        # SAT-B (rel vel = 0.02 km/s)
+            [0.0, 7.0, 0.0],         # SAT-C
+        ])
         
         formations = detect_formations(names, norad_ids, positions, velocities)
         
@@ -88,6 +91,39 @@ class TestFormationDetection:
         assert 10001 in formations[0].norad_ids
         assert 10002 in formations[0].norad_ids
     
+    def test_nan_rows_are_skipped(self):
+        """Test that NaN rows from failed propagation are skipped, not fatal."""
+        names = ['DECAYED', 'SAT-A', 'SAT-B', 'SAT-C']
+        norad_ids = [10000, 10001, 10002, 10003]
+        
+        # propagate_batch leaves NaN rows for objects whose SGP4 call failed
+        positions = np.array([
+            [np.nan, np.nan, np.nan],  # DECAYED
+            [7000.0, 0.0, 0.0],        # SAT-A
+            [7002.0, 0.0, 0.0],        # SAT-B (2 km away)
+            [8000.0, 0.0, 0.0],        # SAT-C (far away)
+        ])
+        velocities = np.array([
+            [np.nan, np.nan, np.nan],
+            [0.0, 7.5, 0.0],
+            [0.0, 7.52, 0.0],
+            [0.0, 7.0, 0.0],
+        ])
+        
+        formations = detect_formations(names, norad_ids, positions, velocities)
+        
+        assert len(formations) == 1
+        assert formations[0].reason == "velocity_based"
+        assert sorted(formations[0].norad_ids) == [10001, 10002]
+        
+        # The same NaN row must not break the per-launch rideshare grouping
+        cospar_ids = ['2025-313A', '2025-313B', '2025-313C', '2025-313D']
+        formations = detect_formations(names, norad_ids, positions=positions, cospar_ids=cospar_ids)
+        
+        assert len(formations) == 1
+        assert formations[0].reason == "rideshare_dispersing"
+        assert sorted(formations[0].norad_ids) == [10001, 10002]
+    
     def test_cospar_rideshare_detection(self):
         """Test COSPAR-based rideshare payload detection."""
         names = ['PAYLOAD-1', 'PAYLOAD-2', 'PAYLOAD-3']
@@ -95,11 +131,11 @@ class TestFormationDetection:
         cospar_ids = ['2025-313A', '2025-313B', '2025-313C']
         
         # All three within 5km
-        positions = [
-            (7000.0, 0.0, 0.0),
-            (7003.0, 0.0, 0.0),
-            (7004.5, 0.0, 0.0),
-        ]
+        positions = np.array([
+            [7000.0, 0.0, 0.0],
+            [7003.0, 0.0, 0.0],
+            [7004.5, 0.0, 0.0],
+        ])
         
         formations = detect_formations(names, norad_ids, positions=positions, cospar_ids=cospar_ids)
         
@@ -107,7 +143,7 @@ class TestFormationDetection:
         rideshare = [f for f in formations if 'Rideshare' in f.name]
         assert len(rideshare) == 1
         assert rideshare[0].reason == "rideshare_dispersing"
-        assert len(rideshare[0].norad_ids) >= 2  # At least 2 objects grouped
+        assert sorted(rideshare[0].norad_ids) == [70001, 70002, 70003]
     
     def test_tandem_formation(self):
         """Test TanDEM-X formation detection."""
@@ -269,6 +305,53 @@ class TestFormationDetection:
         assert len(real_threats) == 1
         assert real_threats[0]['norad_id2'] == 99999
     
+    def test_filter_formation_events_across_formations(self):
+        """Test that IDs from two different formations are not a formation pair."""
+        formations = [
+            FormationGroup(
+                name="Formation A",
+                reason="formation_flying",
+                norad_ids=[50001, 50002],
+                object_names=['SAT-1', 'SAT-2']
+            ),
+            FormationGroup(
+                name="Formation B",
+                reason="formation_flying",
+                norad_ids=[60001, 60002],
+                object_names=['SAT-3', 'SAT-4']
+            ),
+        ]
+        events = [
+            {'name1': 'SAT-1', 'name2': 'SAT-2', 'norad_id1': 50001, 'norad_id2': 50002,
+             'relative_velocity_km_s': 10.0, 'miss_distance_km': 1.0},
+            {'name1': 'SAT-2', 'name2': 'SAT-3', 'norad_id1': 50002, 'norad_id2': 60001,
+             'relative_velocity_km_s': 10.0, 'miss_distance_km': 1.0},
+            {'name1': 'SAT-4', 'name2': 'SAT-3', 'norad_id1': 60002, 'norad_id2': 60001,
+             'relative_velocity_km_s': 10.0, 'miss_distance_km': 1.0},
+        ]
+        
+        real_threats, formation_events = filter_formation_events(events, formations)
+        
+        assert [e['norad_id2'] for e in formation_events] == [50002, 60001]
+        assert [e['norad_id1'] for e in real_threats] == [50002]
+    
+    def test_formation_group_norad_ids_array(self):
+        """Test FormationGroup stores NORAD IDs as int64 with set membership."""
+        group = FormationGroup(
+            name="Test Formation",
+            reason="formation_flying",
+            norad_ids=[50001, 50002],
+            object_names=['SAT-1', 'SAT-2']
+        )
+        
+        assert isinstance(group.norad_ids, np.ndarray)
+        assert group.norad_ids.dtype == np.int64
+        assert 50001 in group
+        assert 99999 not in group
+        # The membership cache is not part of the public dataclass shape
+        assert [f.name for f in fields(group)] == ['name', 'reason', 'norad_ids', 'object_names']
+        assert '_norad_set' not in repr(group)
+    
     def test_mixed_scenario(self):
         """Test complex scenario with multiple formation types."""
         names = [
@@ -307,70 +390,49 @@ class TestFormationDetection:
         assert len(formations) == 1
         assert formations[0].name == "ISS Complex"
     
-    def test_velocity_threshold_boundary(self):
-        """Test velocity threshold at boundary (0.05 km/s)."""
-        names = ['SAT-A', 'SAT-B']
-        norad_ids = [10001, 10002]
-        
-        positions = [
-            (7000.0, 0.0, 0.0),
-            (7003.0, 0.0, 0.0),  # 3 km away
-        ]
-        
-        # Test just below threshold (should be formation)
-        velocities_below = [
-            (0.0, 7.5, 0.0),
-            (0.0, 7.549, 0.0),  # rel vel = 0.049 km/s
-        ]
-        formations = detect_formations(names, norad_ids, positions, velocities_below)
-        assert len(formations) == 1
-        
-        # Test just above threshold (should NOT be formation)
-        velocities_above = [
-            (0.0, 7.5, 0.0),
-            (0.0, 7.551, 0.0),  # rel vel = 0.051 km/s
-        ]
-        formations = detect_formations(names, norad_ids, positions, velocities_above)
-        assert len(formations) == 0
-    
-    def test_distance_threshold_boundary(self):
-        """Test distance threshold at boundary (5 km)."""
+    @pytest.mark.parametrize(
+        "rel_v,dist_km,expected",
+        [
+            (0.049, 3.0, 1),  # just below the 0.05 km/s velocity threshold
+            (0.051, 3.0, 0),  # just above the velocity threshold
+            (0.02, 4.9, 1),   # just inside the 5 km distance threshold
+            (0.02, 5.1, 0),   # just outside the distance threshold
+        ],
+    )
+    def test_colocation_threshold_boundary(self, rel_v, dist_km, expected):
+        """Test velocity (0.05 km/s) and distance (5 km) thresholds at the boundary."""
         names = ['SAT-A', 'SAT-B']
         norad_ids = [10001, 10002]
+        positions = np.array([[7000.0, 0.0, 0.0], [7000.0 + dist_km, 0.0, 0.0]])
+        velocities = np.array([[0.0, 7.5, 0.0], [0.0, 7.5 + rel_v, 0.0]])
         
-        velocities = [
-            (0.0, 7.5, 0.0),
-            (0.0, 7.52, 0.0),  # rel vel = 0.02 km/s (below threshold)
-        ]
-        
-        # Test just below threshold (should be formation)
-        positions_below = [
-            (7000.0, 0.0, 0.0),
-            (7004.9, 0.0, 0.0),  # 4.9 km away
-        ]
-        formations = detect_formations(names, norad_ids, positions_below, velocities)
-        assert len(formations) == 1
-        
-        # Test just above threshold (should NOT be formation)
-        positions_above = [
-            (7000.0, 0.0, 0.0),
-            (7005.1, 0.0, 0.0),  # 5.1 km away
-        ]
-        formations = detect_formations(names, norad_ids, positions_above, velocities)
-        assert len(formations) == 0
+        formations = detect_formations(names, norad_ids, positions, velocities)
+        assert len(formations) == expected
 
 
     def test_mismatched_positions_velocities_length(self):
         """Test that mismatched positions/velocities array lengths raise ValueError or are handled."""
         names = ['SAT-A', 'SAT-B']
         norad_ids = [10001, 10002]
-        positions = [(7000.0, 0.0, 0.0)]  # only 1
-        velocities = [(0.0, 7.5, 0.0), (0.0, 7.5, 0.0)]  # 2
+        positions = np.array([[7000.0, 0.0, 0.0]])  # only 1
+        velocities = np.array([[0.0, 7.5, 0.0], [0.0, 7.5, 0.0]])  # 2
         # positions length != n_objects, so velocity-based detection is skipped (guard clause)
         formations = detect_formations(names, norad_ids, positions, velocities)
         # Should not crash; velocity-based detection simply skipped
         assert isinstance(formations, list)
 
+    def test_list_of_tuples_still_accepted(self):
+        """Test that list-of-tuple positions/velocities match the ndarray path."""
+        names = ['SAT-A', 'SAT-B']
+        norad_ids = [10001, 10002]
+        positions = [(7000.0, 0.0, 0.0), (7002.0, 0.0, 0.0)]
+        velocities = [(0.0, 7.5, 0.0), (0.0, 7.52, 0.0)]
+        
+        from_lists = detect_formations(names, norad_ids, positions, velocities)
+        from_arrays = detect_formations(names, norad_ids, np.array(positions), np.array(velocities))
+        assert from_lists == from_arrays
+        assert len(from_lists) == 1
+
     def test_empty_arrays(self):
         """Test detect_formations with completely empty arrays."""
         formations = detect_formations([], [])
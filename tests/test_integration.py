@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 
 from orbveil.core.tle import TLE, parse_tle
-from orbveil.core.propagation import propagate
+from orbveil.core.propagation import StateVector, propagate
 from orbveil.core.screening import screen, ConjunctionEvent
 
 # Hardcoded real TLEs (no network calls)
@@ -36,32 +36,37 @@ FENGYUN 1C DEB
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def iss_tle() -> TLE:
     tles = parse_tle(ISS_TLE_TEXT)
     assert len(tles) == 1
     return tles[0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def catalog() -> list[TLE]:
     return parse_tle(OTHER_TLES_TEXT)
 
 
+@pytest.fixture(scope="session")
+def iss_states(iss_tle: TLE) -> list[StateVector]:
+    """ISS propagated every 6 hours over 24 hours, computed once per session."""
+    times = [iss_tle.epoch + timedelta(hours=h) for h in range(0, 25, 6)]
+    return propagate(iss_tle, times)
+
+
 def test_parse_iss_tle(iss_tle: TLE):
     """Parse hardcoded ISS TLE."""
     assert iss_tle.norad_id == 25544
     assert iss_tle.name == "ISS (ZARYA)"
 
 
-def test_propagate_iss_24h(iss_tle: TLE):
+def test_propagate_iss_24h(iss_states: list[StateVector]):
     """Propagate ISS 24 hours and verify position is in LEO range."""
-    times = [iss_tle.epoch + timedelta(hours=h) for h in range(0, 25, 6)]
-    states = propagate(iss_tle, times)
-    assert len(states) == 5
+    assert len(iss_states) == 5
 
     earth_radius_km = 6371.0
-    for sv in states:
+    for sv in iss_states:
         r = np.linalg.norm(sv.position_km)
         alt = r - earth_radius_km
         # ISS altitude: ~400 km, allow 200-500 km
@@ -9,132 +9,144 @@ from orbveil.core.probability import (
     PcMethod,
     PcResult,
     compute_pc,
+    compute_pc_batch,
     compute_pc_foster,
     compute_pc_monte_carlo,
+    _mvn_sample,
     _project_to_bplane,
     _relative_state,
 )
 
 
+def _readonly(a: np.ndarray) -> np.ndarray:
+    """Freeze a shared test input so no test can mutate it for the others."""
+    a.setflags(write=False)
+    return a
+
+
+# B-plane inputs shared by the Foster tests (km, km^2)
+_MISS_ZERO = _readonly(np.array([0.0, 0.0]))
+_MISS_100M = _readonly(np.array([0.1, 0.0]))
+_MISS_1KM = _readonly(np.array([1.0, 0.0]))
+_COV_2D_50M = _readonly(np.eye(2) * 0.05**2)
+_COV_2D_100M = _readonly(np.eye(2) * 0.1**2)
+_COV_2D_500M = _readonly(np.eye(2) * 0.5**2)
+
+# 6x6 position+velocity covariances (km, km/s), built once and shared read-only
+_COV_6_ZERO = _readonly(np.zeros((6, 6)))
+_COV_6_50M = _readonly(np.eye(6) * 0.05**2)
+_COV_6_100M = _readonly(np.eye(6) * 0.1**2)
+# 100 m position sigma, 10 m/s velocity sigma
+_COV_6_POS_100M = _readonly(np.diag([0.1**2] * 3 + [0.01**2] * 3))
+# 70 m position sigma, 1 m/s velocity sigma
+_COV_6_POS_70M = _readonly(np.diag([0.07**2] * 3 + [0.001**2] * 3))
+
+# Primary object state shared by the conjunction tests (km, km/s)
+_POS1 = _readonly(np.array([7000.0, 0.0, 0.0]))
+_VEL1 = _readonly(np.array([0.0, 7.5, 0.0]))
+
+
+@pytest.fixture
+def primary_state():
+    """Read-only (position, velocity) of the primary object."""
+    return _POS1, _VEL1
+
+
 class TestRelativeState:
     """Test relative state computation."""
     
     def test_basic_relative_state(self):
         """Test basic relative state calculation."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
+        pos1, vel1 = _POS1, _VEL1
         pos2 = np.array([7000.5, 0.0, 0.0])
         vel2 = np.array([0.0, 7.0, 0.0])
         
         rel_pos, rel_vel = _relative_state(pos1, vel1, pos2, vel2)
         
-        np.testing.assert_array_almost_equal(rel_pos, [0.5, 0.0, 0.0])
-        np.testing.assert_array_almost_equal(rel_vel, [0.0, -0.5, 0.0])
+        assert np.allclose(rel_pos, [0.5, 0.0, 0.0], rtol=0.0, atol=1e-7)
+        assert np.allclose(rel_vel, [0.0, -0.5, 0.0], rtol=0.0, atol=1e-7)
 
 
 class TestBPlaneProjection:
     """Test B-plane projection."""
     
-    def test_bplane_projection_shape(self):
-        """Test that B-plane projection returns correct shapes."""
-        rel_pos = np.array([0.5, 0.0, 0.0])
-        rel_vel = np.array([0.0, 14.0, 0.0])
-        cov = np.eye(6) * 0.1**2  # 0.1 km position uncertainty
-        
-        miss_2d, cov_2d = _project_to_bplane(rel_pos, rel_vel, cov)
+    @pytest.mark.parametrize(
+        "rel_pos,rel_vel",
+        [
+            # rel_pos perpendicular to rel_vel: the full miss lies in the B-plane
+            (np.array([0.5, 0.0, 0.0]), np.array([0.0, 14.0, 0.0])),
+            # General direction: the along-track part must be removed
+            (np.array([0.5, 0.3, 0.2]), np.array([1.0, 2.0, 3.0])),
+            # rel_vel along +z exercises the [1, 0, 0] reference-axis fallback
+            (np.array([0.3, 0.4, 0.5]), np.array([0.0, 0.0, 7.0])),
+        ],
+        ids=["perpendicular", "oblique", "along_z"],
+    )
+    def test_bplane_invariants(self, rel_pos, rel_vel):
+        """Test shapes, symmetry and that the B-plane is perpendicular to rel_vel."""
+        miss_2d, cov_2d = _project_to_bplane(rel_pos, rel_vel, _COV_6_100M)
         
         assert miss_2d.shape == (2,)
         assert cov_2d.shape == (2, 2)
-        assert cov_2d[0, 1] == cov_2d[1, 0]  # Symmetric
-    
-    def test_bplane_miss_distance(self):
-        """Test that B-plane miss distance is correct."""
-        # Relative velocity in y direction
-        rel_pos = np.array([0.5, 0.0, 0.0])
-        rel_vel = np.array([0.0, 14.0, 0.0])
-        cov = np.eye(6) * 0.1**2
+        # Symmetric up to round-off from the two-sided projection
+        assert np.allclose(cov_2d, cov_2d.T, rtol=0.0, atol=1e-15)
         
-        miss_2d, cov_2d = _project_to_bplane(rel_pos, rel_vel, cov)
-        
-        # Miss distance in B-plane should equal magnitude of rel_pos
-        # (since rel_pos is perpendicular to rel_vel)
-        miss_distance = np.linalg.norm(miss_2d)
-        expected_distance = np.linalg.norm(rel_pos)
-        
-        assert abs(miss_distance - expected_distance) < 1e-10
-    
-    def test_bplane_perpendicular_to_velocity(self):
-        """Test that B-plane is perpendicular to relative velocity."""
-        rel_pos = np.array([0.5, 0.3, 0.2])
-        rel_vel = np.array([1.0, 2.0, 3.0])
-        cov = np.eye(6) * 0.1**2
-        
-        # The component of rel_pos along rel_vel should be excluded from miss_2d
+        # Squared 2D miss equals |rel_pos|^2 minus the squared along-track part (Pythagoras)
         z_hat = rel_vel / np.linalg.norm(rel_vel)
-        along_track_component = np.dot(rel_pos, z_hat)
-        
-        miss_2d, _ = _project_to_bplane(rel_pos, rel_vel, cov)
-        
-        # 3D miss vector perpendicular to rel_vel
-        miss_3d_perp = rel_pos - along_track_component * z_hat
-        
-        # 2D miss magnitude should equal perpendicular 3D magnitude
-        assert abs(np.linalg.norm(miss_2d) - np.linalg.norm(miss_3d_perp)) < 1e-10
+        perp_sq = rel_pos @ rel_pos - (rel_pos @ z_hat) ** 2
+        assert abs(miss_2d @ miss_2d - perp_sq) < 1e-10
 
 
 class TestFosterPc:
     """Test Foster (1992) Pc calculation."""
     
-    def test_zero_miss_high_pc(self):
-        """Test that zero miss distance gives high Pc."""
-        miss_2d = np.array([0.0, 0.0])
-        cov_2d = np.eye(2) * 0.1**2  # 0.1 km uncertainty
-        hard_body_radius = 0.020  # 20m in km
-        
-        pc = compute_pc_foster(miss_2d, cov_2d, hard_body_radius)
-        
-        # With zero miss and small HBR, Pc should be very small
-        # (hard body is tiny compared to uncertainty)
-        assert 0.0 <= pc <= 1.0
-    
     def test_large_miss_zero_pc(self):
         """Test that large miss distance gives Pc ≈ 0."""
         miss_2d = np.array([1000.0, 0.0])  # 1000 km miss
-        cov_2d = np.eye(2) * 0.1**2
         hard_body_radius = 0.020  # 20m in km
         
-        pc = compute_pc_foster(miss_2d, cov_2d, hard_body_radius)
+        pc = compute_pc_foster(miss_2d, _COV_2D_100M, hard_body_radius)
         
         assert pc < 1e-10  # Essentially zero
     
-    def test_pc_increases_with_hbr(self):
-        """Test that Pc increases as HBR increases."""
-        miss_2d = np.array([0.1, 0.0])  # 100m miss
-        cov_2d = np.eye(2) * 0.1**2
-        
-        pc_small = compute_pc_foster(miss_2d, cov_2d, 0.020)  # 20m
-        pc_large = compute_pc_foster(miss_2d, cov_2d, 0.100)  # 100m
-        
-        assert pc_large > pc_small
+    @pytest.mark.parametrize(
+        "lower,higher",
+        [
+            # Pc increases as HBR increases (20m -> 100m)
+            ((_MISS_100M, _COV_2D_100M, 0.020), (_MISS_100M, _COV_2D_100M, 0.100)),
+            # Pc decreases as uncertainty increases (more spread over larger area)
+            ((_MISS_100M, _COV_2D_500M, 0.020), (_MISS_100M, _COV_2D_50M, 0.020)),
+            # Pc increases as the miss distance shrinks to zero
+            ((_MISS_1KM, _COV_2D_100M, 0.020), (_MISS_ZERO, _COV_2D_100M, 0.020)),
+        ],
+        ids=["hbr", "uncertainty", "miss_distance"],
+    )
+    def test_foster_monotonicity(self, lower, higher):
+        """Test that Pc moves in the expected direction along each parameter."""
+        pc_lower = compute_pc_foster(*lower)
+        pc_higher = compute_pc_foster(*higher)
+        
+        assert 0.0 <= pc_lower < pc_higher <= 1.0
     
-    def test_pc_decreases_with_uncertainty(self):
-        """Test that Pc decreases as uncertainty increases."""
-        miss_2d = np.array([0.1, 0.0])
-        hard_body_radius = 0.020
-        
-        cov_small = np.eye(2) * 0.05**2  # Small uncertainty
-        cov_large = np.eye(2) * 0.5**2   # Large uncertainty
-        
-        pc_small_cov = compute_pc_foster(miss_2d, cov_small, hard_body_radius)
-        pc_large_cov = compute_pc_foster(miss_2d, cov_large, hard_body_radius)
-        
-        # More uncertainty spreads probability over larger area
-        assert pc_large_cov < pc_small_cov
+    @pytest.mark.parametrize("miss_m", [0.0, 0.2])
+    @pytest.mark.parametrize(
+        "sigmas_m", [(0.03, 1.5), (1.5, 0.03)], ids=["narrow_x", "narrow_y"]
+    )
+    def test_anisotropic_covariance_inside_hbr(self, miss_m, sigmas_m):
+        """Test a very narrow covariance centred inside the hard body gives Pc ≈ 1."""
+        # 3 cm by 1.5 m sigmas against a 218 m HBR: essentially all of the
+        # probability mass lies inside the disk
+        cov_2d = np.diag(np.square(np.array(sigmas_m) / 1000.0))
+        miss_2d = np.array([miss_m / 1000.0, 0.0])
+        
+        pc = compute_pc_foster(miss_2d, cov_2d, 0.218)
+        
+        assert pc == pytest.approx(1.0, abs=1e-9)
     
-    def test_singular_covariance(self):
-        """Test handling of singular covariance."""
+    @pytest.mark.parametrize("cov_2d", [None, np.zeros((2, 2))], ids=["none", "zeros"])
+    def test_singular_covariance(self, cov_2d):
+        """Test handling of a missing or all-zero (singular) covariance."""
         miss_2d = np.array([0.1, 0.0])
-        cov_2d = np.zeros((2, 2))  # Singular
         hard_body_radius = 0.020
         
         pc = compute_pc_foster(miss_2d, cov_2d, hard_body_radius)
@@ -142,77 +154,115 @@ class TestFosterPc:
         assert pc == 0.0
 
 
+@pytest.mark.mc
+@pytest.mark.parametrize("quasi_random", [False, True], ids=["pseudo", "sobol"])
 class TestMonteCartoPc:
-    """Test Monte Carlo Pc calculation."""
+    """Test Monte Carlo Pc calculation (pseudo-random and Sobol sampling)."""
     
-    def test_zero_miss_positive_pc(self):
+    def test_zero_miss_positive_pc(self, quasi_random, mc_seed):
         """Test that zero miss gives positive Pc."""
         rel_pos = np.array([0.0, 0.0, 0.0])
         rel_vel = np.array([0.0, 7.0, 0.0])  # Arbitrary velocity
-        cov = np.eye(6) * 0.1**2
+        cov = _COV_6_100M
         hard_body_radius = 0.020  # 20m in km
         
         pc = compute_pc_monte_carlo(
-            rel_pos, rel_vel, cov, hard_body_radius, n_samples=10_000, seed=42
+            rel_pos, rel_vel, cov, hard_body_radius, n_samples=10_000, seed=mc_seed,
+            quasi_random=quasi_random,
         )
         
         assert pc > 0.0
         assert pc <= 1.0
     
-    def test_large_miss_zero_pc(self):
+    def test_large_miss_zero_pc(self, quasi_random, mc_seed):
         """Test that large miss gives Pc ≈ 0."""
         rel_pos = np.array([1000.0, 0.0, 0.0])  # 1000 km
         rel_vel = np.array([0.0, 7.0, 0.0])
-        cov = np.eye(6) * 0.1**2
+        cov = _COV_6_100M
         hard_body_radius = 0.020
         
         pc = compute_pc_monte_carlo(
-            rel_pos, rel_vel, cov, hard_body_radius, n_samples=10_000, seed=42
+            rel_pos, rel_vel, cov, hard_body_radius, n_samples=10_000, seed=mc_seed,
+            quasi_random=quasi_random,
         )
         
         assert pc == 0.0
     
-    def test_reproducibility(self):
+    def test_reproducibility(self, quasi_random, mc_seed):
         """Test that same seed gives same result."""
         rel_pos = np.array([0.1, 0.0, 0.0])
         rel_vel = np.array([0.0, 7.0, 0.0])
-        cov = np.eye(6) * 0.1**2
+        cov = _COV_6_100M
         hard_body_radius = 0.020
         
-        pc1 = compute_pc_monte_carlo(rel_pos, rel_vel, cov, hard_body_radius, seed=42)
-        pc2 = compute_pc_monte_carlo(rel_pos, rel_vel, cov, hard_body_radius, seed=42)
+        pc1 = compute_pc_monte_carlo(
+            rel_pos, rel_vel, cov, hard_body_radius, seed=mc_seed, quasi_random=quasi_random
+        )
+        pc2 = compute_pc_monte_carlo(
+            rel_pos, rel_vel, cov, hard_body_radius, seed=mc_seed, quasi_random=quasi_random
+        )
+        
+        assert pc1 == pc2
+    
+    def test_reproducibility_with_generator(self, quasi_random, mc_seed):
+        """Test that replaying a generator's state gives the same result."""
+        rel_pos = np.array([0.1, 0.0, 0.0])
+        rel_vel = np.array([0.0, 7.0, 0.0])
+        rng = np.random.default_rng(mc_seed)
+        state = rng.bit_generator.state
+        
+        pc1 = compute_pc_monte_carlo(
+            rel_pos, rel_vel, _COV_6_100M, 0.020, n_samples=10_000,
+            quasi_random=quasi_random, rng=rng,
+        )
+        rng.bit_generator.state = state
+        pc2 = compute_pc_monte_carlo(
+            rel_pos, rel_vel, _COV_6_100M, 0.020, n_samples=10_000,
+            quasi_random=quasi_random, rng=rng,
+        )
         
         assert pc1 == pc2
+        assert pc1 > 0.0
     
-    def test_singular_covariance(self):
-        """Test handling of singular covariance."""
+    @pytest.mark.parametrize("cov", [None, _COV_6_ZERO], ids=["none", "zeros"])
+    def test_singular_covariance(self, quasi_random, cov):
+        """Test handling of a missing or all-zero (singular) covariance."""
         rel_pos = np.array([0.1, 0.0, 0.0])
         rel_vel = np.array([0.0, 7.0, 0.0])
-        cov = np.zeros((6, 6))  # Singular
         hard_body_radius = 0.020
         
-        pc = compute_pc_monte_carlo(rel_pos, rel_vel, cov, hard_body_radius)
+        pc = compute_pc_monte_carlo(
+            rel_pos, rel_vel, cov, hard_body_radius, quasi_random=quasi_random
+        )
         
         assert pc == 0.0
+    
+    def test_sampler_semidefinite_covariance(self, quasi_random, mc_seed):
+        """Test that a rank-deficient covariance samples within its subspace."""
+        mean = np.array([0.1, 0.0, 0.0])
+        cov = np.diag([0.1**2, 0.1**2, 0.0])  # no spread along z
+        
+        samples = _mvn_sample(mean, cov, 4096, seed=mc_seed, quasi_random=quasi_random)
+        
+        assert samples.shape == (4096, 3)
+        assert np.all(samples[:, 2] == 0.0)
+        assert np.allclose(samples.mean(axis=0), mean, atol=0.01)
+        assert np.allclose(samples[:, :2].std(axis=0), 0.1, rtol=0.05)
 
 
 class TestComputePc:
     """Test main compute_pc function."""
     
-    def test_basic_computation(self):
+    def test_basic_computation(self, primary_state):
         """Test basic Pc computation."""
         # Two satellites in similar orbits, small miss distance
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
+        pos1, vel1 = primary_state
         pos2 = np.array([7000.5, 0.0, 0.0])  # 0.5 km apart
         vel2 = np.array([0.0, 7.0, 0.0])
         
         # Position uncertainty: 0.1 km
-        cov1 = np.eye(6)
-        cov1[:3, :3] *= 0.1**2  # Position covariance
-        cov1[3:, 3:] *= 0.01**2  # Velocity covariance
-        
-        cov2 = cov1.copy()
+        cov1 = _COV_6_POS_100M
+        cov2 = _COV_6_POS_100M
         
         result = compute_pc(
             pos1, vel1, pos2, vel2, cov1, cov2,
@@ -245,13 +295,8 @@ class TestComputePc:
         vel2 = np.array([0.0, -6.5, 1.5])  # Creates ~14 km/s relative velocity
         
         # Combined position uncertainty ~0.1 km in each axis
-        cov1 = np.eye(6)
-        cov1[:3, :3] *= 0.07**2  # ~70m position uncertainty
-        cov1[3:, 3:] *= 0.001**2
-        
-        cov2 = np.eye(6)
-        cov2[:3, :3] *= 0.07**2  # ~70m position uncertainty
-        cov2[3:, 3:] *= 0.001**2
+        cov1 = _COV_6_POS_70M  # ~70m position uncertainty
+        cov2 = _COV_6_POS_70M
         
         result = compute_pc(
             pos1, vel1, pos2, vel2, cov1, cov2,
@@ -268,92 +313,131 @@ class TestComputePc:
         # 0.5km miss with 70m sigma and 20m HBR gives Pc ~1e-8 to 1e-5
         assert 1e-10 <= result.probability <= 1e-3
     
-    def test_foster_vs_monte_carlo(self):
-        """Test that Foster and Monte Carlo methods agree for high-Pc scenario."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
-        pos2 = np.array([7000.005, 0.0, 0.0])  # 5m apart — very close
+    @pytest.mark.mc
+    def test_foster_vs_monte_carlo(self, primary_state):
+        """Test that Foster and quasi-Monte Carlo agree for an exact-overlap scenario."""
+        pos1, vel1 = primary_state
+        # Zero miss, 50m sigma per object and a 100m HBR: the combined B-plane
+        # sigma is 50*sqrt(2) m, so Pc = 1 - exp(-R^2 / (2 sigma^2)) = 1 - e^-1
         vel2 = np.array([0.0, 7.0, 0.0])
         
-        # Large uncertainty to make Pc measurable by MC
-        cov1 = np.eye(6) * 0.01**2  # 10m position sigma
-        cov2 = np.eye(6) * 0.01**2
-        
         result_foster = compute_pc(
-            pos1, vel1, pos2, vel2, cov1, cov2,
-            hard_body_radius_m=20.0,
+            pos1, vel1, pos1, vel2, _COV_6_50M, _COV_6_50M,
+            hard_body_radius_m=100.0,
             method=PcMethod.FOSTER_1992
         )
         
+        # Quasi-MC (Sobol) converges ~O(1/N), so 20K samples is plenty here
         result_mc = compute_pc(
-            pos1, vel1, pos2, vel2, cov1, cov2,
-            hard_body_radius_m=20.0,
+            pos1, vel1, pos1, vel2, _COV_6_50M, _COV_6_50M,
+            hard_body_radius_m=100.0,
+            method=PcMethod.QUASI_MONTE_CARLO,
+            mc_samples=20_000
+        )
+        
+        assert result_foster.probability == pytest.approx(1.0 - np.exp(-1.0), rel=1e-6)
+        relative_error = abs(result_foster.probability - result_mc.probability) / result_foster.probability
+        assert relative_error < 0.1
+        assert result_mc.samples == 20_000
+    
+    @pytest.mark.mc
+    def test_foster_vs_monte_carlo_100k(self, primary_state):
+        """Test Foster against 100K pseudo-random Monte Carlo samples."""
+        pos1, vel1 = primary_state
+        vel2 = np.array([0.0, 7.0, 0.0])
+        
+        result_foster = compute_pc(
+            pos1, vel1, pos1, vel2, _COV_6_50M, _COV_6_50M,
+            hard_body_radius_m=100.0,
+            method=PcMethod.FOSTER_1992
+        )
+        result_mc = compute_pc(
+            pos1, vel1, pos1, vel2, _COV_6_50M, _COV_6_50M,
+            hard_body_radius_m=100.0,
             method=PcMethod.MONTE_CARLO,
             mc_samples=100_000
         )
         
-        # Methods should agree within ~10% for large sample size
-        # (or within absolute error for very small Pc)
-        if result_foster.probability > 1e-4:
-            relative_error = abs(result_foster.probability - result_mc.probability) / result_foster.probability
-            assert relative_error < 0.5  # 50% tolerance — MC with 100K samples has high variance
-        else:
-            # For very small Pc, check absolute difference
-            assert abs(result_foster.probability - result_mc.probability) < 1e-4
-        
+        # Binomial standard error at Pc ~0.63 and N = 100K is ~0.0015
+        assert result_foster.probability == pytest.approx(result_mc.probability, abs=0.01)
         assert result_mc.samples == 100_000
     
-    def test_pc_zero_for_large_separation(self):
-        """Test that Pc is essentially zero for large separation."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
-        pos2 = np.array([8000.0, 0.0, 0.0])  # 1000 km apart
+    def test_pc_miss_sweep(self, primary_state):
+        """Test that Pc falls as the miss distance grows, in one batched call."""
+        pos1, vel1 = primary_state
         vel2 = np.array([0.0, 7.0, 0.0])
+        misses_km = np.array([0.1, 0.5, 1.0, 1000.0])
         
-        cov1 = np.eye(6) * 0.1**2
-        cov2 = np.eye(6) * 0.1**2
-        
-        result = compute_pc(
-            pos1, vel1, pos2, vel2, cov1, cov2,
+        n = len(misses_km)
+        pos2s = pos1 + misses_km[:, None] * np.array([1.0, 0.0, 0.0])
+        results = compute_pc_batch(
+            np.tile(pos1, (n, 1)), np.tile(vel1, (n, 1)), pos2s, np.tile(vel2, (n, 1)),
+            _COV_6_100M, _COV_6_100M,
             hard_body_radius_m=20.0
         )
+        probability = np.array([r.probability for r in results])
         
-        assert result.probability < 1e-10
+        # Pc strictly decreases from 100m to 1km and is essentially zero at 1000 km
+        assert np.all(np.diff(probability[:3]) < 0)
+        assert probability[-1] < 1e-10
     
-    def test_pc_increases_with_closer_approach(self):
-        """Test that Pc increases as objects get closer."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
-        vel2 = np.array([0.0, 7.0, 0.0])
-        
-        cov1 = np.eye(6) * 0.1**2
-        cov2 = np.eye(6) * 0.1**2
-        
-        # Far approach
-        pos2_far = np.array([7001.0, 0.0, 0.0])  # 1 km
-        result_far = compute_pc(
-            pos1, vel1, pos2_far, vel2, cov1, cov2,
-            hard_body_radius_m=20.0
+    def test_pc_batch_matches_single(self, primary_state):
+        """Test that each batched result matches the scalar compute_pc call."""
+        pos1, vel1 = primary_state
+        pos2s = np.array([[7000.1, 0.0, 0.0], [7000.3, 0.0, 0.4]])
+        vel2s = np.array([[0.0, 7.0, 0.0], [0.0, -6.5, 1.5]])
+        
+        results = compute_pc_batch(
+            np.tile(pos1, (2, 1)), np.tile(vel1, (2, 1)), pos2s, vel2s,
+            _COV_6_100M, np.stack([_COV_6_100M, _COV_6_POS_70M]),
         )
         
-        # Close approach
-        pos2_close = np.array([7000.1, 0.0, 0.0])  # 100m
-        result_close = compute_pc(
-            pos1, vel1, pos2_close, vel2, cov1, cov2,
-            hard_body_radius_m=20.0
+        for result, pos2, vel2, cov2 in zip(results, pos2s, vel2s, [_COV_6_100M, _COV_6_POS_70M]):
+            single = compute_pc(pos1, vel1, pos2, vel2, _COV_6_100M, cov2)
+            assert result.probability == pytest.approx(single.probability, rel=1e-9)
+            assert result.mahalanobis_distance == pytest.approx(single.mahalanobis_distance)
+    
+    @pytest.mark.parametrize(
+        "batch_cov, single_cov",
+        [
+            (None, None),
+            (np.diag(_COV_6_100M), np.diag(_COV_6_100M)),
+            (_COV_6_100M, _COV_6_100M),
+            (np.stack([_COV_6_100M, _COV_6_100M]), _COV_6_100M),
+        ],
+        ids=["none", "diagonal", "shared", "per_row"],
+    )
+    def test_pc_batch_covariance_forms(self, primary_state, batch_cov, single_cov):
+        """Test that the batch accepts every covariance form compute_pc does."""
+        pos1, vel1 = primary_state
+        pos2s = np.array([[7000.1, 0.0, 0.0], [7000.3, 0.0, 0.4]])
+        vel2s = np.array([[0.0, 7.0, 0.0], [0.0, -6.5, 1.5]])
+        
+        results = compute_pc_batch(
+            np.tile(pos1, (2, 1)), np.tile(vel1, (2, 1)), pos2s, vel2s,
+            batch_cov, batch_cov,
         )
         
-        assert result_close.probability > result_far.probability
+        for result, pos2, vel2 in zip(results, pos2s, vel2s):
+            single = compute_pc(pos1, vel1, pos2, vel2, single_cov, single_cov)
+            assert result.probability == pytest.approx(single.probability, rel=1e-9)
     
-    def test_mahalanobis_distance(self):
+    def test_pc_batch_bad_covariance_shape_raises(self, primary_state):
+        """Test that an unsupported covariance shape raises a clear ValueError."""
+        pos1, vel1 = primary_state
+        with pytest.raises(ValueError, match="Batch covariance"):
+            compute_pc_batch(
+                pos1, vel1, pos1 + 0.1, vel1, np.eye(3), _COV_6_100M,
+            )
+    
+    def test_mahalanobis_distance(self, primary_state):
         """Test that Mahalanobis distance is computed."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
+        pos1, vel1 = primary_state
         pos2 = np.array([7000.5, 0.0, 0.0])
         vel2 = np.array([0.0, 7.0, 0.0])
         
-        cov1 = np.eye(6) * 0.1**2
-        cov2 = np.eye(6) * 0.1**2
+        cov1 = _COV_6_100M
+        cov2 = _COV_6_100M
         
         result = compute_pc(
             pos1, vel1, pos2, vel2, cov1, cov2,
@@ -363,15 +447,29 @@ class TestComputePc:
         assert result.mahalanobis_distance is not None
         assert result.mahalanobis_distance > 0
     
-    def test_invalid_method_raises(self):
+    def test_diagonal_covariance_matches_dense(self, primary_state):
+        """Test that length-6 variance vectors give the same result as 6x6 matrices."""
+        pos1, vel1 = primary_state
+        pos2 = np.array([7000.3, 0.0, 0.4])
+        vel2 = np.array([0.0, -6.5, 1.5])
+        variances = np.diag(_COV_6_POS_70M)
+        
+        dense = compute_pc(pos1, vel1, pos2, vel2, _COV_6_POS_70M, _COV_6_POS_70M)
+        diagonal = compute_pc(pos1, vel1, pos2, vel2, variances, variances)
+        mixed = compute_pc(pos1, vel1, pos2, vel2, variances, _COV_6_POS_70M)
+        
+        for result in (diagonal, mixed):
+            assert result.probability == pytest.approx(dense.probability, rel=1e-9)
+            assert result.mahalanobis_distance == pytest.approx(dense.mahalanobis_distance)
+    
+    def test_invalid_method_raises(self, primary_state):
         """Test that invalid method raises error."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
+        pos1, vel1 = primary_state
         pos2 = np.array([7000.5, 0.0, 0.0])
         vel2 = np.array([0.0, 7.0, 0.0])
         
-        cov1 = np.eye(6) * 0.1**2
-        cov2 = np.eye(6) * 0.1**2
+        cov1 = _COV_6_100M
+        cov2 = _COV_6_100M
         
         with pytest.raises(ValueError, match="Unknown method"):
             # Create a fake method enum value
@@ -387,35 +485,46 @@ class TestComputePc:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    def test_zero_covariance(self):
-        """Test with zero covariance (deterministic positions)."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
+    @pytest.mark.parametrize(
+        "method, samples",
+        [
+            (PcMethod.FOSTER_1992, None),
+            (PcMethod.MONTE_CARLO, 5_000),
+            (PcMethod.QUASI_MONTE_CARLO, 5_000),
+        ],
+        ids=["foster", "mc", "qmc"],
+    )
+    @pytest.mark.parametrize("cov", [None, _COV_6_ZERO], ids=["none", "zeros"])
+    def test_zero_covariance(self, primary_state, cov, method, samples):
+        """Test with missing or zero covariance (deterministic positions)."""
+        pos1, vel1 = primary_state
         pos2 = np.array([7001.0, 0.0, 0.0])
         vel2 = np.array([0.0, 7.0, 0.0])
         
-        cov1 = np.zeros((6, 6))
-        cov2 = np.zeros((6, 6))
+        cov1 = cov
+        cov2 = cov
         
         # Should handle gracefully (Pc = 0 since no uncertainty)
         result = compute_pc(
             pos1, vel1, pos2, vel2, cov1, cov2,
             hard_body_radius_m=20.0,
-            method=PcMethod.FOSTER_1992
+            method=method,
+            mc_samples=5_000,
         )
         
         assert result.probability == 0.0
+        # The early exit reports the sample count it stands in for, like any MC result
+        assert result.samples == samples
     
-    def test_very_large_covariance(self):
+    def test_very_large_covariance(self, primary_state):
         """Test with very large covariance."""
-        pos1 = np.array([7000.0, 0.0, 0.0])
-        vel1 = np.array([0.0, 7.5, 0.0])
+        pos1, vel1 = primary_state
         pos2 = np.array([7000.5, 0.0, 0.0])
         vel2 = np.array([0.0, 7.0, 0.0])
         
-        # Very large uncertainty (100 km)
-        cov1 = np.eye(6) * 100.0**2
-        cov2 = np.eye(6) * 100.0**2
+        # Very large uncertainty (100 km), given as diagonal variances
+        cov1 = np.full(6, 100.0**2)
+        cov2 = np.full(6, 100.0**2)
         
         result = compute_pc(
             pos1, vel1, pos2, vel2, cov1, cov2,
@@ -426,13 +535,12 @@ class TestEdgeCases:
         assert 0.0 <= result.probability <= 1.0
         assert result.probability < 1e-6  # Should be very small
     
-    def test_exact_overlap(self):
+    def test_exact_overlap(self, primary_state):
         """Test with objects at exactly the same position."""
-        pos = np.array([7000.0, 0.0, 0.0])
-        vel = np.array([0.0, 7.5, 0.0])
+        pos, vel = primary_state
         
-        cov1 = np.eye(6) * 0.1**2
-        cov2 = np.eye(6) * 0.1**2
+        cov1 = _COV_6_100M
+        cov2 = _COV_6_100M
         
         result = compute_pc(
             pos, vel, pos, vel, cov1, cov2,
@@ -1,6 +1,7 @@
 """Tests for propagation edge cases."""
 from __future__ import annotations
 
+import warnings
 from datetime import datetime, timedelta, timezone
 
 import numpy as np
@@ -13,49 +14,127 @@ from orbveil.core.propagation import propagate, propagate_batch
 ISS_LINE1 = "1 25544U 98067A   24045.54896019  .00016717  00000-0  30093-3 0  9993"
 ISS_LINE2 = "2 25544  51.6412 207.4925 0004948 290.5508 178.9792 15.49583488439596"
 
-# Near-circular orbit (eccentricity ~0.0005)
-CIRCULAR_LINE1 = ISS_LINE1
-CIRCULAR_LINE2 = ISS_LINE2
-
-
-@pytest.fixture
-def iss_tle() -> TLE:
-    return TLE.from_lines(ISS_LINE1, ISS_LINE2)
+# Mixed LEO/MEO/HEO/GEO pool for driving the SatrecArray batch path. The first
+# four entries are the suite's reference TLEs (see conftest); the rest are
+# SYNTHETIC element sets that only imitate typical orbit classes. Their NORAD
+# numbers and designators are placeholders, not the published TLEs of any real
+# object, so do not use them as reference data.
+_TLE_POOL = (
+    ("1 25544U 98067A   24045.54896019  .00016717  00000-0  30093-3 0  9993",  # reference: ISS
+     "2 25544  51.6412 207.4925 0004948 290.5508 178.9792 15.49583488439596"),
+    ("1 20580U 90037B   24045.55478014  .00001456  00000-0  73052-4 0  9994",  # reference: Hubble
+     "2 20580  28.4701  41.0696 0002622 348.3544 140.2428 15.09435694872912"),
+    ("1 48274U 21035A   24045.50261574  .00021540  00000-0  25163-3 0  9993",  # reference: CSS
+     "2 48274  41.4681 279.1498 0005372 149.8847 345.3740 15.62096269157018"),
+    ("1 36516U 10012A   24045.39583333  .00000112  00000-0  00000+0 0  9991",  # reference: GEO
+     "2 36516   0.0254 268.0254 0000567 142.5432 240.3076  1.00271953 50780"),
+    ("1 44713U 19074A   24045.41666667  .00002118  00000-0  15862-3 0  9994",  # synthetic: LEO shell, 53 deg
+     "2 44713  53.0544 312.7718 0001523  85.4420 274.6746 15.06394015233014"),
+    ("1 44714U 19074B   24045.37500000  .00001934  00000-0  14513-3 0  9995",  # synthetic: LEO shell, 53 deg
+     "2 44714  53.0541 312.9427 0001389  92.1170 267.9961 15.06390845233019"),
+    ("1 45044U 20001A   24045.45833333  .00001702  00000-0  12863-3 0  9990",  # synthetic: LEO shell, 53 deg
+     "2 45044  53.0542 252.3196 0001340  80.6677 279.4466 15.06397284222153"),
+    ("1 53544U 22100A   24045.50000000  .00003405  00000-0  22972-3 0  9993",  # synthetic: LEO shell, 43 deg
+     "2 53544  43.0021  98.1467 0001567 271.3908  88.6853 15.10390623 82713"),
+    ("1 24876U 97035A   24045.29166667 -.00000062  00000-0  00000+0 0  9997",  # synthetic: MEO, 12 h
+     "2 24876  55.7211 111.6540 0041856  56.0938 304.3370  2.00563020192913"),
+    ("1 36585U 10022A   24045.33333333 -.00000081  00000-0  00000+0 0  9990",  # synthetic: MEO, 12 h
+     "2 36585  54.3790 229.5642 0112547  51.8724 309.3110  2.00561734101630"),
+    ("1 43873U 18109A   24045.62500000  .00000037  00000-0  00000+0 0  9991",  # synthetic: MEO, 12 h
+     "2 43873  55.1024 171.9005 0022163 187.1563 172.8511  2.00561547 38356"),
+    ("1 33591U 09005A   24045.58333333  .00000204  00000-0  13514-3 0  9994",  # synthetic: sun-synchronous LEO
+     "2 33591  99.1947  97.4651 0013592 136.1712 224.0521 14.12775563777856"),
+    ("1 25994U 99068A   24045.54166667  .00000338  00000-0  84127-4 0  9997",  # synthetic: sun-synchronous LEO
+     "2 25994  98.0838 119.8871 0001311  95.4612 264.6728 14.59173420281849"),
+    ("1 40697U 15028A   24045.43750000  .00000103  00000-0  55521-4 0  9992",  # synthetic: sun-synchronous LEO
+     "2 40697  98.5688 120.1187 0001188  93.9174 266.2143 14.30815960454175"),
+    ("1 25485U 98054A   24045.20833333  .00000126  00000-0  10311-2 0  9997",  # synthetic: Molniya-type HEO
+     "2 25485  64.2041 283.5582 6916380 281.9417  12.0354  2.00617405182158"),
+    ("1 34427U 93036SX  24045.12500000  .00000488  00000-0  18174-3 0  9998",  # synthetic: debris-like LEO
+     "2 34427  74.0342 101.4275 0085512  13.3791 346.9584 14.46018873791229"),
+)
+
+
+# ISS epoch as a naive UTC datetime64, for far-future offsets without datetime arithmetic
+_ISS_EPOCH64 = np.datetime64(
+    TLE.from_lines(ISS_LINE1, ISS_LINE2).epoch.replace(tzinfo=None), "ns"
+)
+
+
+@pytest.fixture(scope="session")
+def tle_pool() -> list[TLE]:
+    return [TLE.from_lines(line1, line2) for line1, line2 in _TLE_POOL]
 
 
 def test_propagation_stale_tle(iss_tle: TLE):
     """Test propagation far beyond epoch — should succeed or raise ValueError, not crash."""
-    far_future = iss_tle.epoch + timedelta(days=365 * 10)
+    far_future = _ISS_EPOCH64 + np.timedelta64(365 * 10, "D")
     try:
-        states = propagate(iss_tle, [far_future])
+        states = propagate(iss_tle, np.array([far_future]))
         # If it succeeds, position should still be finite (or NaN from degraded accuracy)
         assert len(states) == 1
     except ValueError:
         pass  # SGP4 error is acceptable for stale TLEs
 
 
-def test_propagation_zero_eccentricity():
+def test_propagation_zero_eccentricity(iss_tle: TLE):
     """Test propagation of TLE with very low eccentricity (ISS ~0.0005)."""
-    tle = TLE.from_lines(CIRCULAR_LINE1, CIRCULAR_LINE2)
-    assert tle.eccentricity < 0.001
-    states = propagate(tle, [tle.epoch + timedelta(hours=1)])
+    assert iss_tle.eccentricity < 0.001
+    states = propagate(iss_tle, [iss_tle.epoch + timedelta(hours=1)])
     pos_mag = np.linalg.norm(states[0].position_km)
     assert 6500 < pos_mag < 7000  # still in LEO
 
 
-def test_batch_propagation_one_bad_tle(iss_tle: TLE):
-    """Test batch propagation where one TLE may fail — valid mask should reflect it."""
-    # Use ISS twice; both should succeed. We verify the valid mask mechanism works.
-    tles = [iss_tle, iss_tle]
+@pytest.mark.parametrize("n", [1, 2, 16])
+def test_batch_propagation(tle_pool: list[TLE], iss_tle: TLE, n: int):
+    """Test batch propagation over distinct satellites matches single-object propagation."""
+    tles = tle_pool[:n]
     states, valid = propagate_batch(tles, iss_tle.epoch)
-    assert states.shape == (2, 6)
+    assert states.shape == (n, 6)
+    assert states.dtype == np.float64
+    assert states.flags.c_contiguous
+    assert valid.shape == (n,)
     assert np.all(valid)
 
+    for tle, state in zip(tles, states):
+        single = propagate(tle, [iss_tle.epoch])[0]
+        np.testing.assert_allclose(state[:3], single.position_km, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(state[3:], single.velocity_km_s, rtol=0, atol=1e-9)
+
 
 def test_batch_propagation_far_future(iss_tle: TLE):
     """Test batch propagation far from epoch — some may fail."""
-    far = iss_tle.epoch + timedelta(days=365 * 50)
+    far = _ISS_EPOCH64 + np.timedelta64(365 * 50, "D")
     states, valid = propagate_batch([iss_tle], far)
     # Either succeeds or valid[0] is False
     assert states.shape == (1, 6)
     assert valid.shape == (1,)
+
+
+def test_datetime64_matches_datetime(iss_tle: TLE):
+    """Test that np.datetime64 times propagate to the same states as datetimes."""
+    times = [iss_tle.epoch + timedelta(minutes=m) for m in (0, 45, 90)]
+    times64 = _ISS_EPOCH64 + np.array([0, 45, 90], dtype="timedelta64[m]")
+
+    for state, state64 in zip(propagate(iss_tle, times), propagate(iss_tle, times64)):
+        np.testing.assert_allclose(state64.position_km, state.position_km, rtol=0, atol=1e-6)
+        assert state64.epoch == state.epoch
+
+    batch, _ = propagate_batch([iss_tle], times[1])
+    batch64, _ = propagate_batch([iss_tle], times64[1])
+    np.testing.assert_allclose(batch64, batch, rtol=0, atol=1e-6)
+
+
+def test_object_array_of_aware_datetimes(iss_tle: TLE):
+    """Test that an object array of aware datetimes keeps the caller's tzinfo."""
+    cet = timezone(timedelta(hours=1))
+    times = [(iss_tle.epoch + timedelta(minutes=m)).astimezone(cet) for m in (0, 45)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        states = propagate(iss_tle, np.array(times, dtype=object))
+
+    assert [s.epoch for s in states] == times
+    assert all(s.epoch.tzinfo is cet for s in states)
+    for state, expected in zip(states, propagate(iss_tle, times)):
+        np.testing.assert_array_equal(state.position_km, expected.position_km)
@@ -14,50 +14,22 @@ from orbveil.core.screening import (
 )
 
 
-# Test TLEs
-ISS_TLE_LINES = (
-    "1 25544U 98067A   24045.54896019  .00016717  00000-0  30093-3 0  9993",
-    "2 25544  51.6412 207.4925 0004948 290.5508 178.9792 15.49583488439596",
-)
-
-CSS_TLE_LINES = (
-    "1 48274U 21035A   24045.50261574  .00021540  00000-0  25163-3 0  9993",
-    "2 48274  41.4681 279.1498 0005372 149.8847 345.3740 15.62096269157018",
-)
-
-HUBBLE_TLE_LINES = (
-    "1 20580U 90037B   24045.55478014  .00001456  00000-0  73052-4 0  9994",
-    "2 20580  28.4701  41.0696 0002622 348.3544 140.2428 15.09435694872912",
-)
-
-GEO_TLE_LINES = (
-    "1 36516U 10012A   24045.39583333  .00000112  00000-0  00000+0 0  9991",
-    "2 36516   0.0254 268.0254 0000567 142.5432 240.3076  1.00271953 50780",
-)
-
-
-@pytest.fixture
-def iss_tle() -> TLE:
-    """ISS TLE for testing."""
-    return TLE.from_lines(ISS_TLE_LINES[0], ISS_TLE_LINES[1], "ISS (ZARYA)")
+# Reference screen shared by the structural screening tests. This is the
+# long-horizon run (2 days, 30 min grid) kept for integration coverage.
+_REFERENCE_SCREEN_DAYS = 2.0
 
+# Structural invariants (emptiness, self-exclusion, primary bookkeeping)
+# hold for any run, so the remaining screen() calls use a 6 h / 60 min grid.
+_SHORT_SCREEN = {"days": 0.25, "step_minutes": 60.0}
 
-@pytest.fixture
-def css_tle() -> TLE:
-    """Chinese Space Station (Tiangong) TLE for testing."""
-    return TLE.from_lines(CSS_TLE_LINES[0], CSS_TLE_LINES[1], "CSS (TIANHE)")
 
-
-@pytest.fixture
-def hubble_tle() -> TLE:
-    """Hubble Space Telescope TLE for testing."""
-    return TLE.from_lines(HUBBLE_TLE_LINES[0], HUBBLE_TLE_LINES[1], "HUBBLE")
-
-
-@pytest.fixture
-def geo_tle() -> TLE:
-    """GEO satellite TLE for testing."""
-    return TLE.from_lines(GEO_TLE_LINES[0], GEO_TLE_LINES[1], "SES-1")
+@pytest.fixture(scope="module")
+def iss_vs_leo_events(iss_tle: TLE, css_tle: TLE, hubble_tle: TLE) -> list[ConjunctionEvent]:
+    """ISS screened against CSS and Hubble once, at a generous 10,000 km threshold."""
+    return screen(
+        iss_tle, [css_tle, hubble_tle],
+        days=_REFERENCE_SCREEN_DAYS, threshold_km=10000.0, step_minutes=30.0,
+    )
 
 
 def test_propagate_single_time(iss_tle: TLE):
@@ -92,12 +64,10 @@ def test_propagate_multiple_times(iss_tle: TLE):
         assert states[i].epoch == times[i]
 
 
-def test_propagate_batch_shape(iss_tle: TLE, css_tle: TLE, hubble_tle: TLE):
+def test_propagate_batch_shape(batch_states: tuple[np.ndarray, np.ndarray]):
     """Test batch propagation returns correct shape."""
-    tles = [iss_tle, css_tle, hubble_tle]
-    time = iss_tle.epoch
-    
-    states, valid = propagate_batch(tles, time)
+    # ISS, CSS and Hubble rows of the shared reference batch
+    states, valid = batch_states[0][:3], batch_states[1][:3]
     
     assert states.shape == (3, 6)
     assert valid.shape == (3,)
@@ -201,38 +171,40 @@ def test_prefilter_mixed_catalog(iss_tle: TLE, css_tle: TLE, geo_tle: TLE):
 def test_screen_no_conjunctions_with_geo(iss_tle: TLE, geo_tle: TLE):
     """Test that screening ISS against GEO finds no conjunctions."""
     catalog = [geo_tle]
-    events = screen(iss_tle, catalog, days=1.0, threshold_km=1000.0, step_minutes=60.0)
+    events = screen(iss_tle, catalog, threshold_km=1000.0, **_SHORT_SCREEN)
     
     # GEO and ISS should never get close
     assert len(events) == 0
 
 
-def test_screen_basic_structure(iss_tle: TLE, css_tle: TLE):
+def test_screen_basic_structure(
+    iss_tle: TLE, css_tle: TLE, hubble_tle: TLE, iss_vs_leo_events: list[ConjunctionEvent]
+):
     """Test basic structure of screening results."""
-    catalog = [css_tle]
-    events = screen(iss_tle, catalog, days=0.5, threshold_km=5000.0, step_minutes=30.0)
+    events = iss_vs_leo_events
+    catalog_ids = frozenset(tle.norad_id for tle in (css_tle, hubble_tle))
+    primary_id = iss_tle.norad_id
     
-    # Should return a list (may be empty)
+    # Should return a non-empty list at this generous threshold
     assert isinstance(events, list)
+    assert events
     
-    # If events found, check structure
     for event in events:
         assert isinstance(event, ConjunctionEvent)
-        assert event.primary_norad_id == iss_tle.norad_id
-        assert event.secondary_norad_id in [tle.norad_id for tle in catalog]
+        assert event.primary_norad_id == primary_id
+        assert event.secondary_norad_id in catalog_ids
         assert isinstance(event.tca, datetime)
         assert event.miss_distance_km >= 0
         assert event.relative_velocity_km_s >= 0
 
 
-def test_screen_sorted_by_distance(iss_tle: TLE, css_tle: TLE, hubble_tle: TLE):
+def test_screen_sorted_by_distance(iss_vs_leo_events: list[ConjunctionEvent]):
     """Test that screening results are sorted by miss distance."""
-    catalog = [css_tle, hubble_tle]
-    events = screen(iss_tle, catalog, days=1.0, threshold_km=10000.0, step_minutes=60.0)
+    events = iss_vs_leo_events
     
     # Events should be sorted by miss_distance_km
-    for i in range(1, len(events)):
-        assert events[i].miss_distance_km >= events[i-1].miss_distance_km
+    d = np.fromiter((e.miss_distance_km for e in events), dtype=np.float64, count=len(events))
+    assert (np.diff(d) >= 0).all()
 
 
 def test_screen_multiple_primaries(iss_tle: TLE, css_tle: TLE, hubble_tle: TLE):
@@ -240,54 +212,54 @@ def test_screen_multiple_primaries(iss_tle: TLE, css_tle: TLE, hubble_tle: TLE):
     primaries = [iss_tle, css_tle]
     catalog = [hubble_tle]
     
-    events = screen(primaries, catalog, days=0.5, threshold_km=5000.0, step_minutes=60.0)
+    events = screen(primaries, catalog, threshold_km=5000.0, **_SHORT_SCREEN)
     
     # Should check both primaries
     assert isinstance(events, list)
     
     # If events found, should have both primaries represented (potentially)
-    primary_ids = {event.primary_norad_id for event in events}
+    primary_ids = frozenset(event.primary_norad_id for event in events)
     # At least one of the primaries should be in results (if any events found)
     if events:
-        assert primary_ids.issubset({iss_tle.norad_id, css_tle.norad_id})
+        assert primary_ids <= frozenset(tle.norad_id for tle in primaries)
 
 
 def test_screen_excludes_self_conjunctions(iss_tle: TLE, css_tle: TLE):
     """Test that screening doesn't report self-conjunctions."""
     catalog = [iss_tle, css_tle]
-    events = screen(iss_tle, catalog, days=1.0, threshold_km=10000.0, step_minutes=60.0)
+    events = screen(iss_tle, catalog, threshold_km=10000.0, **_SHORT_SCREEN)
     
     # Should not have any events with primary == secondary
     for event in events:
         assert event.primary_norad_id != event.secondary_norad_id
 
 
-def test_screen_threshold_filters(iss_tle: TLE, css_tle: TLE):
+def test_screen_threshold_filters(
+    iss_tle: TLE, css_tle: TLE, hubble_tle: TLE, iss_vs_leo_events: list[ConjunctionEvent]
+):
     """Test that threshold parameter filters results."""
-    catalog = [css_tle]
-    
-    # Very tight threshold
-    tight_events = screen(iss_tle, catalog, days=1.0, threshold_km=1.0, step_minutes=60.0)
-    
-    # Looser threshold
-    loose_events = screen(iss_tle, catalog, days=1.0, threshold_km=5000.0, step_minutes=60.0)
+    # Tighter threshold than the shared reference run (10,000 km), same grid
+    tight_events = screen(
+        iss_tle, [css_tle, hubble_tle],
+        days=_REFERENCE_SCREEN_DAYS, threshold_km=1000.0, step_minutes=30.0,
+    )
+    loose_events = iss_vs_leo_events
     
     # Looser threshold should find at least as many events
     assert len(loose_events) >= len(tight_events)
+    assert all(e.miss_distance_km <= 1000.0 for e in tight_events)
     
     # All tight events should be in loose events
-    tight_pairs = {(e.primary_norad_id, e.secondary_norad_id) for e in tight_events}
-    loose_pairs = {(e.primary_norad_id, e.secondary_norad_id) for e in loose_events}
-    assert tight_pairs.issubset(loose_pairs)
+    tight_pairs = frozenset((e.primary_norad_id, e.secondary_norad_id) for e in tight_events)
+    loose_pairs = frozenset((e.primary_norad_id, e.secondary_norad_id) for e in loose_events)
+    assert tight_pairs <= loose_pairs
 
 
-def test_propagation_error_handling():
+def test_propagation_error_handling(iss_tle: TLE):
     """Test that propagation handles errors gracefully."""
-    # Create a TLE with an invalid date far in the future (may cause propagation errors)
+    # Propagate to a date far in the future (may cause propagation errors)
     # For this test, we'll just verify the error handling exists
     # In practice, SGP4 is quite robust, so errors are rare with valid TLEs
-    iss_tle = TLE.from_lines(ISS_TLE_LINES[0], ISS_TLE_LINES[1])
-    
     # Try propagating very far into the future (100 years)
     far_future = iss_tle.epoch + timedelta(days=365*100)
     
@@ -302,83 +274,72 @@ def test_propagation_error_handling():
         assert "SGP4 propagation failed" in str(e)
 
 
-def test_batch_propagation_performance(iss_tle: TLE, css_tle: TLE, hubble_tle: TLE, geo_tle: TLE):
+def test_batch_propagation_performance(iss_tle: TLE, batch_states: tuple[np.ndarray, np.ndarray]):
     """Test that batch propagation works with multiple satellites."""
-    # Create a larger catalog
-    tles = [iss_tle, css_tle, hubble_tle, geo_tle]
-    time = iss_tle.epoch
-    
-    states, valid = propagate_batch(tles, time)
+    states, valid = batch_states
     
     assert states.shape == (4, 6)
     assert valid.shape == (4,)
     
     # All valid TLEs should propagate successfully
     assert np.sum(valid) >= 3  # At least most should succeed
+    
+    # The ISS row matches single-object propagation at the same time
+    single = propagate(iss_tle, [iss_tle.epoch])[0]
+    np.testing.assert_allclose(states[0, 0:3], single.position_km, rtol=1e-10)
 
 
-def test_relative_velocity_calculation(iss_tle: TLE, css_tle: TLE):
+def test_relative_velocity_calculation(iss_vs_leo_events: list[ConjunctionEvent]):
     """Test that relative velocity is calculated correctly."""
-    catalog = [css_tle]
-    events = screen(iss_tle, catalog, days=0.5, threshold_km=10000.0, step_minutes=60.0)
-    
-    # If we found events, check relative velocity is reasonable
-    for event in events:
+    for event in iss_vs_leo_events:
         # LEO satellites have orbital velocity ~7-8 km/s
         # Relative velocity should be less than ~16 km/s (sum of both velocities)
         # and greater than 0
         assert 0 < event.relative_velocity_km_s < 20.0
 
 
-def test_tca_is_in_screening_window(iss_tle: TLE, css_tle: TLE):
+def test_tca_is_in_screening_window(iss_tle: TLE, iss_vs_leo_events: list[ConjunctionEvent]):
     """Test that TCA is within the screening window."""
-    catalog = [css_tle]
-    days = 2.0
-    events = screen(iss_tle, catalog, days=days, threshold_km=5000.0, step_minutes=60.0)
-    
     start = iss_tle.epoch
-    end = start + timedelta(days=days)
+    end = start + timedelta(days=_REFERENCE_SCREEN_DAYS)
     
-    for event in events:
+    for event in iss_vs_leo_events:
         # TCA should be within the screening window
         assert start <= event.tca <= end + timedelta(hours=1)  # small buffer for refinement
 
 
 def test_screen_empty_catalog(iss_tle: TLE):
     """Test screening against empty catalog returns empty list."""
-    events = screen(iss_tle, [], days=1.0, threshold_km=10.0)
+    events = screen(iss_tle, [], threshold_km=10.0, **_SHORT_SCREEN)
     assert events == []
 
 
 def test_screen_self_only_catalog(iss_tle: TLE):
     """Test screening against catalog containing only self returns empty list."""
-    events = screen(iss_tle, [iss_tle], days=1.0, threshold_km=10.0)
+    events = screen(iss_tle, [iss_tle], threshold_km=10.0, **_SHORT_SCREEN)
     assert events == []
 
 
-def test_screen_decayed_tle(iss_tle: TLE):
+def test_screen_decayed_tle(iss_tle: TLE, css_tle: TLE):
     """Test screening with a TLE that may cause propagation errors (very old epoch)."""
-    # Create a TLE with a very old epoch by using ISS lines but propagating far
-    # The screening should handle propagation errors gracefully (skip bad objects)
-    catalog = [iss_tle]
-    # Screen with ISS against itself won't find anything (self-exclusion), 
-    # but we can verify no crash. Use css_tle-like object.
-    css_lines = (
-        "1 48274U 21035A   24045.50261574  .00021540  00000-0  25163-3 0  9993",
-        "2 48274  41.4681 279.1498 0005372 149.8847 345.3740 15.62096269157018",
-    )
-    css = TLE.from_lines(css_lines[0], css_lines[1])
+    # The screening should handle propagation errors gracefully (skip bad objects).
+    # ISS against itself would be self-excluded, so screen CSS against ISS.
     # Screen far from epoch — propagation may degrade but shouldn't crash
-    events = screen(css, [iss_tle], days=0.5, threshold_km=5000.0, step_minutes=60.0)
+    events = screen(css_tle, [iss_tle], days=0.5, threshold_km=5000.0, step_minutes=60.0)
     assert isinstance(events, list)
 
 
 class TestScreenCatalog:
     """Tests for the KD-tree based screen_catalog function."""
 
+    # The KD-tree path is exercised the same way on any horizon, so the
+    # structural tests use 0.5 h / 15 min; test_screen_catalog_basic keeps
+    # the 2 h / 10 min grid as the longer regression run.
+
     def test_screen_catalog_basic(self, iss_tle: TLE, css_tle: TLE, hubble_tle: TLE):
         """Test screen_catalog with a small set of LEO objects."""
         tles = [iss_tle, css_tle, hubble_tle]
+        catalog_ids = frozenset(tle.norad_id for tle in tles)
         # Use epoch of ISS as reference so propagation is near-epoch
         events = screen_catalog(
             tles,
@@ -390,6 +351,8 @@ class TestScreenCatalog:
         assert isinstance(events, list)
         for ev in events:
             assert isinstance(ev, ConjunctionEvent)
+            assert ev.primary_norad_id in catalog_ids
+            assert ev.secondary_norad_id in catalog_ids
             assert ev.miss_distance_km <= 5000.0
             assert ev.miss_distance_km >= 0
             assert ev.relative_velocity_km_s >= 0
@@ -398,13 +361,13 @@ class TestScreenCatalog:
         """Test that screen_catalog results are sorted by miss distance."""
         events = screen_catalog(
             [iss_tle, css_tle, hubble_tle],
-            hours=2.0,
-            step_minutes=10.0,
+            hours=0.5,
+            step_minutes=15.0,
             threshold_km=10000.0,
             reference_time=iss_tle.epoch,
         )
-        for i in range(1, len(events)):
-            assert events[i].miss_distance_km >= events[i - 1].miss_distance_km
+        d = np.fromiter((e.miss_distance_km for e in events), dtype=np.float64, count=len(events))
+        assert (np.diff(d) >= 0).all()
 
     def test_screen_catalog_empty(self):
         """Test screen_catalog with no TLEs."""
@@ -420,8 +383,8 @@ class TestScreenCatalog:
         """GEO and LEO objects should not produce close approaches at 10km threshold."""
         events = screen_catalog(
             [iss_tle, geo_tle],
-            hours=2.0,
-            step_minutes=10.0,
+            hours=0.5,
+            step_minutes=15.0,
             threshold_km=10.0,
             reference_time=iss_tle.epoch,
         )
@@ -444,30 +407,26 @@ class TestScreenCatalog:
 class TestFilterStaleTles:
     """Tests for filter_stale_tles."""
 
-    def test_all_fresh(self, iss_tle: TLE, css_tle: TLE):
-        """TLEs near their epoch should pass the filter."""
-        ref = iss_tle.epoch + timedelta(hours=1)
-        result = filter_stale_tles([iss_tle, css_tle], max_age_days=3.0, reference_time=ref)
-        assert len(result) == 2
-
-    def test_all_stale(self, iss_tle: TLE, css_tle: TLE):
-        """TLEs far from reference time should be filtered out."""
-        ref = iss_tle.epoch + timedelta(days=30)
-        result = filter_stale_tles([iss_tle, css_tle], max_age_days=3.0, reference_time=ref)
-        assert len(result) == 0
-
-    def test_mixed(self, iss_tle: TLE, css_tle: TLE):
-        """Only fresh TLEs should survive filtering."""
-        # ISS and CSS epochs are very close, so use a ref that makes one stale
-        # They're both from epoch day ~45, so offset by ~2 days from ISS
-        ref = iss_tle.epoch + timedelta(days=2)
-        # With max_age_days=1.5, ISS (2 days old) is stale, CSS (~2 days old) may also be stale
-        # Use a tighter window: ref = iss_tle.epoch, max_age = 0.5 days
-        # CSS epoch is ~0.05 days different from ISS epoch
-        ref = iss_tle.epoch
-        result = filter_stale_tles([iss_tle, css_tle], max_age_days=0.5, reference_time=ref)
-        # ISS is exactly at ref (age=0), should pass
-        assert iss_tle in result
+    # (reference offset from the ISS epoch in days, max_age_days, ISS kept, CSS kept).
+    # The CSS epoch is ~0.046 days (~67 min) before the ISS epoch.
+    @pytest.mark.parametrize(
+        "ref_offset, max_age, iss_kept, css_kept",
+        [
+            pytest.param(1 / 24, 3.0, True, True, id="all_fresh"),
+            pytest.param(30.0, 3.0, False, False, id="all_stale"),
+            pytest.param(0.0, 0.04, True, False, id="mixed"),
+        ],
+    )
+    def test_filter(
+        self, iss_tle: TLE, css_tle: TLE,
+        ref_offset: float, max_age: float, iss_kept: bool, css_kept: bool,
+    ):
+        """Only TLEs within max_age_days of the reference time survive."""
+        ref = iss_tle.epoch + timedelta(days=ref_offset)
+        result = filter_stale_tles([iss_tle, css_tle], max_age_days=max_age, reference_time=ref)
+        assert len(result) == iss_kept + css_kept
+        assert (iss_tle in result) == iss_kept
+        assert (css_tle in result) == css_kept
 
     def test_empty_input(self):
         """Empty list returns empty list."""
@@ -480,12 +439,12 @@ class TestScreenEdgeCases:
 
     def test_screen_empty_catalog(self, iss_tle: TLE):
         """Screen against empty catalog returns no events."""
-        events = screen(iss_tle, [], days=1.0)
+        events = screen(iss_tle, [], **_SHORT_SCREEN)
         assert events == []
 
     def test_screen_single_object_catalog(self, iss_tle: TLE):
         """Screen primary against catalog containing only itself returns no events."""
-        events = screen(iss_tle, [iss_tle], days=1.0, threshold_km=10000.0)
+        events = screen(iss_tle, [iss_tle], threshold_km=10000.0, **_SHORT_SCREEN)
         assert events == []
 
 
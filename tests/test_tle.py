@@ -1,5 +1,7 @@
 """Tests for TLE parsing."""
 
+import pickle
+
 import pytest
 
 from orbveil.core.tle import TLE, parse_tle
@@ -11,6 +13,9 @@ ISS_LINE2 = "2 25544  51.6412 207.4925 0004948 290.5508 178.9792 15.495834884395
 
 
 class TestTLEFromLines:
+    # str(TLE) emits the name as a "0 " title line followed by both lines
+    _EXPECTED_STR = f"0 {ISS_NAME}\n{ISS_LINE1}\n{ISS_LINE2}"
+
     def test_parse_basic(self) -> None:
         tle = TLE.from_lines(ISS_LINE1, ISS_LINE2, name=ISS_NAME)
         assert tle.norad_id == 25544
@@ -37,10 +42,15 @@ class TestTLEFromLines:
 
     def test_str_roundtrip(self) -> None:
         tle = TLE.from_lines(ISS_LINE1, ISS_LINE2, name=ISS_NAME)
-        text = str(tle)
-        assert ISS_LINE1 in text
-        assert ISS_LINE2 in text
-        assert ISS_NAME in text
+        assert str(tle) == self._EXPECTED_STR
+
+    def test_pickle_roundtrip(self) -> None:
+        tle = TLE.from_lines(ISS_LINE1, ISS_LINE2, name=ISS_NAME)
+        restored = pickle.loads(pickle.dumps(tle))
+        assert restored == tle
+        assert restored.satrec is not tle.satrec
+        # The rebuilt Satrec propagates identically
+        assert restored.satrec.sgp4(2460355.0, 0.5) == tle.satrec.sgp4(2460355.0, 0.5)
 
     def test_invalid_line1_raises(self) -> None:
         with pytest.raises(ValueError, match="Invalid TLE line 1"):